@@ -13,7 +13,8 @@ Configuration:
         export CAR_PROFILE=badlands_4kg
     
 Dependencies:
-    pip3 install aiortc aiohttp pyserial pynmea2
+    pip3 install aiortc aiohttp pyserial
+    pip3 install orjson uvloop  # optional, faster JSON responses and event loop
 
 Usage:
     CAR_PROFILE=badlands_4kg TOKEN_SECRET="your-secret" python3 control-relay.py
@@ -23,18 +24,29 @@ import asyncio
 import struct
 import socket
 import hmac
-import hashlib
 import time
 import logging
 import os
 import math
 import re
 import json
+import signal
 import subprocess
+import functools
+import operator
+import threading
 import serial
-import pynmea2
 import RPi.GPIO as GPIO
-from aiohttp import web, ClientSession
+try:
+    import orjson  # Optional: much faster JSON encoding for float-heavy payloads
+except ImportError:
+    orjson = None
+try:
+    import uvloop  # Optional: libuv-based event loop, faster socket I/O and timers
+except ImportError:
+    uvloop = None
+from aiohttp import web, ClientSession, ClientTimeout
+from multidict import CIMultiDict, CIMultiDictProxy
 from aiortc import RTCPeerConnection, RTCSessionDescription, RTCConfiguration, RTCIceServer
 from bno055_reader import BNO055
 from hall_rpm import HallRPM
@@ -59,26 +71,25 @@ logger = logging.getLogger(__name__)
 
 MEDIAMTX_API_URL = "http://127.0.0.1:9997"
 recording_active = False
+mediamtx_session = None  # Long-lived ClientSession (created in main), reuses its keep-alive connection
 
 async def start_recording():
     """Start MediaMTX recording via REST API."""
     global recording_active
     
     try:
-        async with ClientSession() as session:
-            async with session.patch(
-                f"{MEDIAMTX_API_URL}/v3/config/paths/patch/cam",
-                json={"record": True},
-                timeout=5
-            ) as resp:
-                if resp.status == 200:
-                    recording_active = True
-                    logger.info("Recording started")
-                    return True
-                else:
-                    error = await resp.text()
-                    logger.error(f"Failed to start recording: {resp.status} - {error}")
-                    return False
+        async with mediamtx_session.patch(
+            f"{MEDIAMTX_API_URL}/v3/config/paths/patch/cam",
+            json={"record": True}
+        ) as resp:
+            if resp.status == 200:
+                recording_active = True
+                logger.info("Recording started")
+                return True
+            else:
+                error = await resp.text()
+                logger.error(f"Failed to start recording: {resp.status} - {error}")
+                return False
     except Exception as e:
         logger.error(f"Error starting recording: {e}")
         return False
@@ -91,20 +102,18 @@ async def stop_recording():
         return True
     
     try:
-        async with ClientSession() as session:
-            async with session.patch(
-                f"{MEDIAMTX_API_URL}/v3/config/paths/patch/cam",
-                json={"record": False},
-                timeout=5
-            ) as resp:
-                if resp.status == 200:
-                    recording_active = False
-                    logger.info("Recording stopped")
-                    return True
-                else:
-                    error = await resp.text()
-                    logger.error(f"Failed to stop recording: {resp.status} - {error}")
-                    return False
+        async with mediamtx_session.patch(
+            f"{MEDIAMTX_API_URL}/v3/config/paths/patch/cam",
+            json={"record": False}
+        ) as resp:
+            if resp.status == 200:
+                recording_active = False
+                logger.info("Recording stopped")
+                return True
+            else:
+                error = await resp.text()
+                logger.error(f"Failed to stop recording: {resp.status} - {error}")
+                return False
     except Exception as e:
         logger.error(f"Error stopping recording: {e}")
         return False
@@ -160,8 +169,8 @@ def log_telemetry_frame():
         return
     
     # Calculate race time
-    if race_state == "racing" and race_start_time:
-        race_time_ms = int((time.time() - race_start_time) * 1000)
+    if race_state == "racing" and race_start_monotonic is not None:
+        race_time_ms = int((time.monotonic() - race_start_monotonic) * 1000)
     else:
         race_time_ms = 0
     
@@ -195,8 +204,8 @@ def log_telemetry_frame():
     if traction_ctrl and traction_enabled:
         status = traction_ctrl.get_status()
         frame["traction"] = {
-            "slip_detected": status['slip_detected'],
-            "throttle_mult": status['throttle_multiplier']
+            "slip_detected": status.slip_detected,
+            "throttle_mult": round(status.throttle_multiplier, 2)
         }
     
     if stability_ctrl and stability_enabled:
@@ -241,6 +250,7 @@ GPS_BAUD = 9600  # Try 38400 if 9600 doesn't work
 # Token authentication (must match generate-token.js)
 # Set via environment variable: export TOKEN_SECRET="your-secret-key"
 TOKEN_SECRET = os.environ.get('TOKEN_SECRET', 'change-me-in-production')
+TOKEN_SECRET_BYTES = TOKEN_SECRET.encode()  # HMAC key, encoded once
 
 # Admin password for /admin/* endpoints (must match ADMIN_PASSWORD in Cloudflare Worker)
 ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD', '')
@@ -272,21 +282,40 @@ CMD_SURFACE_ADAPT = 0x11 # Surface adaptation toggle (browser -> Pi)
 # Race sub-commands (sent as payload after CMD_RACE)
 RACE_START_COUNTDOWN = 0x01
 RACE_STOP = 0x02
+RACE_RESUME = 0x03  # Reconnected during an active race: go straight to racing
 
 # Status sub-commands (browser -> Pi)
 STATUS_VIDEO = 0x01
 STATUS_READY = 0x02
 
+# Precompiled wire formats for server-initiated messages (seq=0)
+CONFIG_STRUCT = struct.Struct('<HBbBBBBBBB')  # seq(2) + cmd(1) + reserved(1) + 7 flags = 11 bytes
+RACE_STRUCT = struct.Struct('<HBB')           # seq(2) + cmd(1) + sub_cmd(1)
+TURBO_STRUCT = struct.Struct('<HBB')          # seq(2) + cmd(1) + turbo(1)
+KICK_MESSAGE = struct.pack('<HB', 0, CMD_KICK)  # seq(2) + cmd(1), no payload
+
+# Precompiled wire formats for browser -> Pi messages
+MSG_HEADER_STRUCT = struct.Struct('<HB')      # seq(2) + cmd(1)
+CTRL_STRUCT = struct.Struct('<HBhh')          # seq(2) + cmd(1) + throttle(2) + steering(2)
+STATUS_STRUCT = struct.Struct('<HBBB')        # seq(2) + cmd(1) + sub_cmd(1) + value(1)
+TOGGLE_STRUCT = struct.Struct('<HBB')         # seq(2) + cmd(1) + enabled(1)
+
+# Precompiled telemetry broadcast formats (see broadcast_*_telemetry for field layout)
+TELEM_STRUCT = struct.Struct('<HBIhh iiHHB HBh I')                 # 33 bytes
+DEBUG_TELEM_STRUCT = struct.Struct('<HB BBB hhh B B H hhh h BB BB Bh')  # 31 bytes
+EXTENDED_TELEM_STRUCT = struct.Struct('<HB BBBhB BhBh Bh HHB bB')       # 25 bytes
+
 # ----- State -----
 
-# UDP socket for sending to ESP32
-udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-udp_sock.setblocking(False)
+# UDP transport for sending to ESP32 (asyncio datagram endpoint connected to the
+# discovered ESP32, recreated by BeaconProtocol when its IP changes)
+# transport.sendto() never blocks the event loop - it buffers if the socket is busy
+udp_transport = None
 
 # Active peer connections and data channels
 pc = None
 control_channel = None  # Primary browser control channel
-data_channels = []  # All connected data channels (for telemetry broadcast)
+data_channels = set()  # All connected data channels (for telemetry broadcast)
 
 def is_connected():
     """Check if any client is connected via data channel"""
@@ -305,7 +334,7 @@ gps_lon = 0.0       # Longitude in degrees
 gps_speed = 0.0     # Speed in km/h
 gps_heading = 0.0   # Heading/track in degrees
 gps_fix = False     # Has valid GPS fix
-gps_task = None     # Asyncio task for GPS reading
+gps_thread = None   # Dedicated thread for GPS serial reading + parsing
 
 # IMU (BNO055) state
 imu_heading = 0.0        # BNO055 fused heading (degrees, 0=North)
@@ -398,6 +427,7 @@ IMU_MOUNT_OFFSET = _cfg.get_float('heading_blend', 'imu_mount_offset_deg')
 # Race state: "idle" (controls blocked), "countdown" (controls blocked), "racing" (controls allowed)
 race_state = "idle"
 race_start_time = None  # Unix timestamp when race started (after countdown)
+race_start_monotonic = None  # time.monotonic() at race start, for elapsed race time
 countdown_task = None  # Asyncio task for countdown timer
 
 turbo_mode = False     # Turbo mode: increases limits (ESP32 enforces hard limits)
@@ -519,6 +549,7 @@ async def wifi_monitor_loop():
 # Revoked tokens (persisted to file, keeps last 10)
 REVOKED_TOKENS_FILE = '/home/pi/revoked_tokens.txt'
 revoked_tokens = []  # List to maintain order
+revoked_set = set()  # Same tokens, for O(1) lookup in validate_token
 current_player_token = None  # Track current player's token for kick functionality
 
 # Rate limiting for WebRTC offer endpoints (IP -> list of timestamps)
@@ -529,7 +560,7 @@ rate_limit_tracker = {}  # IP -> [timestamp1, timestamp2, ...]
 
 def load_revoked_tokens():
     """Load revoked tokens from file on startup"""
-    global revoked_tokens
+    global revoked_tokens, revoked_set
     try:
         with open(REVOKED_TOKENS_FILE, 'r') as f:
             revoked_tokens = [line.strip() for line in f if line.strip()]
@@ -540,29 +571,121 @@ def load_revoked_tokens():
     except Exception as e:
         logger.warning(f"Error loading revoked tokens: {e}")
         revoked_tokens = []
+    revoked_set = set(revoked_tokens)
 
-def save_revoked_tokens():
-    """Save revoked tokens to file (keep last 10)"""
+def save_revoked_tokens(tokens: list):
+    """Save revoked tokens to file (keep last 10). Blocking - runs in the default executor"""
     try:
         with open(REVOKED_TOKENS_FILE, 'w') as f:
-            for token in revoked_tokens[-10:]:
+            for token in tokens[-10:]:
                 f.write(token + '\n')
     except Exception as e:
         logger.warning(f"Error saving revoked tokens: {e}")
 
+# Revocations are persisted after a short quiet period, so a burst of kicks
+# results in a single file write off the event loop
+REVOKED_SAVE_DELAY = 1.0  # seconds
+_pending_revoked_save = None  # asyncio.TimerHandle for the scheduled save
+
+def flush_revoked_tokens():
+    """Write a snapshot of the revoked list from a worker thread"""
+    global _pending_revoked_save
+    _pending_revoked_save = None
+    asyncio.get_running_loop().run_in_executor(None, save_revoked_tokens, list(revoked_tokens))
+
+def schedule_revoked_save():
+    """(Re)schedule flush_revoked_tokens() after REVOKED_SAVE_DELAY of quiet"""
+    global _pending_revoked_save
+    if _pending_revoked_save:
+        _pending_revoked_save.cancel()
+    _pending_revoked_save = asyncio.get_running_loop().call_later(REVOKED_SAVE_DELAY, flush_revoked_tokens)
+
 def revoke_token(token: str):
     """Add token to revoked list and persist"""
-    global revoked_tokens
-    if token not in revoked_tokens:
+    global revoked_tokens, revoked_set
+    if token not in revoked_set:
         revoked_tokens.append(token)
+        revoked_set.add(token)
         # Keep only last 10
         if len(revoked_tokens) > 10:
             revoked_tokens = revoked_tokens[-10:]
-        save_revoked_tokens()
+            revoked_set = set(revoked_tokens)
+        schedule_revoked_save()
         logger.info(f"Revoked token: {token[:8]}... (total: {len(revoked_tokens)})")
 
 # ----- Telemetry Broadcast -----
 
+# Per-channel outbound queues: telemetry is queued and sent by a writer task per
+# channel, so a slow subscriber drops stale frames instead of building a backlog
+CHANNEL_QUEUE_SIZE = 4             # Max queued telemetry frames per channel
+CHANNEL_BUFFER_HIGH_WATER = 16384  # Wait for SCTP to drain (bufferedamountlow) above this many buffered bytes
+channel_writers = {}  # channel -> (asyncio.Queue, writer task)
+open_channels = set()  # Subset of data_channels that are open (maintained by open/close events)
+
+async def channel_writer(channel, queue: asyncio.Queue):
+    """Drain a channel's outbound queue at the pace the channel can actually send"""
+    drained = asyncio.Event()
+    channel.bufferedAmountLowThreshold = CHANNEL_BUFFER_HIGH_WATER
+    @channel.on("bufferedamountlow")
+    def on_buffered_amount_low():
+        drained.set()
+    @channel.on("close")
+    def on_close():
+        drained.set()  # Don't wait on a buffer that will never drain
+    while True:
+        message = await queue.get()
+        # Let the SCTP buffer drain first; newer frames replace older ones meanwhile
+        while channel.readyState == "open" and channel.bufferedAmount > CHANNEL_BUFFER_HIGH_WATER:
+            drained.clear()
+            await drained.wait()
+        if channel.readyState != "open":
+            continue
+        try:
+            channel.send(message)
+        except Exception as e:
+            logger.warning(f"Error sending to channel '{channel.label}': {e}")
+
+def add_data_channel(channel):
+    """Register a channel for telemetry broadcast and start its writer task"""
+    data_channels.add(channel)
+    # Remote-created channels are usually already open when handed to us
+    if channel.readyState == "open":
+        open_channels.add(channel)
+    else:
+        @channel.on("open")
+        def on_open():
+            if channel in data_channels:
+                open_channels.add(channel)
+    if channel not in channel_writers:
+        queue = asyncio.Queue(maxsize=CHANNEL_QUEUE_SIZE)
+        channel_writers[channel] = (queue, asyncio.create_task(channel_writer(channel, queue)))
+
+def remove_data_channel(channel):
+    """Unregister a channel from telemetry broadcast and stop its writer task"""
+    data_channels.discard(channel)
+    open_channels.discard(channel)
+    writer = channel_writers.pop(channel, None)
+    if writer:
+        writer[1].cancel()
+
+def broadcast_to_channels(message: bytes, label: str):
+    """Queue one pre-serialized frame for every open data channel (no per-channel state checks).
+    The frame is built once per tick and the same bytes object is shared by all subscribers.
+    If a channel's queue is full, its oldest frame is dropped so it always gets current state.
+    """
+    for channel in tuple(open_channels):  # Snapshot to avoid mutation during iteration
+        try:
+            writer = channel_writers.get(channel)
+            if writer is None:
+                channel.send(message)
+                continue
+            queue = writer[0]
+            if queue.full():
+                queue.get_nowait()  # Drop oldest frame
+            queue.put_nowait(message)
+        except Exception as e:
+            logger.warning(f"Error sending {label}: {e}")
+
 def broadcast_telemetry():
     """Broadcast telemetry to all connected data channels"""
     global data_channels, race_state, race_start_time, current_throttle, current_steering
@@ -588,8 +711,8 @@ def broadcast_telemetry():
         )
     
     # Calculate race time in milliseconds
-    if race_state == "racing" and race_start_time:
-        race_time_ms = int((time.time() - race_start_time) * 1000)
+    if race_state == "racing" and race_start_monotonic is not None:
+        race_time_ms = int((time.monotonic() - race_start_monotonic) * 1000)
     else:
         race_time_ms = 0
     
@@ -617,19 +740,14 @@ def broadcast_telemetry():
     # Format: seq(2) + cmd(1) + race_time(4) + throttle(2) + steering(2) + 
     #         lat(4) + lon(4) + speed(2) + gps_heading(2) + fix(1) +
     #         imu_heading(2) + calibration(1) + yaw_rate(2) + wheel_dist(4) = 33 bytes
-    message = struct.pack('<HBIhh iiHHB HBh I', 
+    message = TELEM_STRUCT.pack(
         0, CMD_TELEM, race_time_ms, current_throttle, current_steering,
         lat_scaled, lon_scaled, speed_scaled, gps_heading_scaled, 1 if gps_fix else 0,
         imu_heading_scaled, cal_packed, yaw_rate_scaled, wheel_distance_cm
     )
     
-    # Send to all connected data channels
-    for channel in data_channels[:]:  # Copy list to avoid mutation during iteration
-        try:
-            if channel.readyState == "open":
-                channel.send(message)
-        except Exception as e:
-            logger.warning(f"Error sending telemetry: {e}")
+    # Send the same frame to all connected data channels
+    broadcast_to_channels(message, "telemetry")
     
     # Log telemetry to file if recording
     log_telemetry_frame()
@@ -653,14 +771,14 @@ def broadcast_debug_telemetry():
     # LowSpeedTractionManager has: _slip_detected, _phase, slip_ratio, wheel_accel, vehicle_accel
     if traction_ctrl:
         status = traction_ctrl.get_status()
-        tc_slip_detected = 1 if (traction_enabled and status['slip_detected']) else 0
+        tc_slip_detected = 1 if (traction_enabled and status.slip_detected) else 0
         # Encode phase as reason: 1=launch, 2=transition, 3=cruise
         phase_map = {'launch': 1, 'transition': 2, 'cruise': 3}
-        tc_slip_reason = phase_map.get(status['phase'], 0) if traction_enabled else 0
-        tc_throttle_mult = int(status['throttle_multiplier'] * 100) if traction_enabled else 100
-        tc_wheel_accel = int(max(-3276.7, min(3276.7, status['wheel_accel'])) * 10)
-        tc_vehicle_accel = int(max(-3276.7, min(3276.7, status['vehicle_accel'])) * 10)
-        tc_slip_ratio = int(max(-327.67, min(327.67, status['slip_ratio'])) * 100)
+        tc_slip_reason = phase_map.get(status.phase, 0) if traction_enabled else 0
+        tc_throttle_mult = round(status.throttle_multiplier * 100) if traction_enabled else 100
+        tc_wheel_accel = int(max(-3276.7, min(3276.7, status.wheel_accel)) * 10)
+        tc_vehicle_accel = int(max(-3276.7, min(3276.7, status.vehicle_accel)) * 10)
+        tc_slip_ratio = int(max(-327.67, min(327.67, status.slip_ratio)) * 100)
     
     # Yaw Rate Controller: intervention_type(1), throttle_mult(1), virtual_brake(2), yaw_desired(2), yaw_actual(2), yaw_error(2)
     yrc_intervention = 0  # 0=none, 1=oversteer, 2=understeer
@@ -713,7 +831,7 @@ def broadcast_debug_telemetry():
     #   SS: steering_limit(1) + rate_limited(1) + counter_steer(1) + counter_amount(2) = 5 bytes
     # Total: 3 + 9 + 10 + 4 + 5 = 31 bytes
     
-    message = struct.pack('<HB BBB hhh B B H hhh h BB BB Bh',
+    message = DEBUG_TELEM_STRUCT.pack(
         0, CMD_DEBUG_TELEM,
         # Traction Control (9 bytes)
         tc_slip_detected, tc_slip_reason, tc_throttle_mult,
@@ -729,13 +847,8 @@ def broadcast_debug_telemetry():
         ss_counter_steer, ss_counter_amount
     )
     
-    # Send to all connected data channels
-    for channel in data_channels[:]:
-        try:
-            if channel.readyState == "open":
-                channel.send(message)
-        except Exception as e:
-            logger.warning(f"Error sending debug telemetry: {e}")
+    # Send the same frame to all connected data channels
+    broadcast_to_channels(message, "debug telemetry")
 
 
 def broadcast_extended_telemetry():
@@ -774,9 +887,9 @@ def broadcast_extended_telemetry():
     
     if hill_hold_ctrl:
         status = hill_hold_ctrl.get_status()
-        hh_active = 1 if (hill_hold_enabled and status['active']) else 0
-        hh_hold_force = status['hold_force']
-        hh_blend = int(status['blend_factor'] * 100)
+        hh_active = 1 if (hill_hold_enabled and status.active) else 0
+        hh_hold_force = status.hold_force
+        hh_blend = round(status.blend_factor * 100)
         hh_pitch = int(max(-1800, min(1800, imu_pitch)) * 10)
     
     # Coast Control: active(1), injection(2) = 3 bytes
@@ -815,7 +928,7 @@ def broadcast_extended_telemetry():
     #   WiFi: rssi(1) + link_quality(1) = 2 bytes
     # Total: 3 + 6 + 6 + 3 + 5 + 2 = 25 bytes
     
-    message = struct.pack('<HB BBBhB BhBh Bh HHB bB',
+    message = EXTENDED_TELEM_STRUCT.pack(
         0, CMD_EXTENDED_TELEM,
         # ABS (6 bytes)
         abs_active, abs_direction, abs_phase, abs_slip_ratio, abs_esc_state,
@@ -829,19 +942,94 @@ def broadcast_extended_telemetry():
         wifi_rssi, wifi_lq
     )
     
-    # Send to all connected data channels
-    for channel in data_channels[:]:
-        try:
-            if channel.readyState == "open":
-                channel.send(message)
-        except Exception as e:
-            logger.warning(f"Error sending extended telemetry: {e}")
+    # Send the same frame to all connected data channels
+    broadcast_to_channels(message, "extended telemetry")
+
+
+def nmea_checksum_ok(line: str) -> bool:
+    """Verify the trailing *XX checksum (sentences without one are accepted)"""
+    star = line.rfind('*')
+    if star < 0:
+        return True
+    # XOR over the ASCII bytes - reduce() iterates in C instead of a Python-level loop
+    checksum = functools.reduce(operator.xor, line[1:star].encode('ascii'), 0)
+    try:
+        return checksum == int(line[star + 1:star + 3], 16)
+    except ValueError:
+        return False
 
+def nmea_coord(value: str, hemisphere: str) -> float:
+    """Convert NMEA DDMM.MMMM / DDDMM.MMMM + hemisphere to signed decimal degrees"""
+    if not value:
+        return 0.0
+    ddmm = float(value)
+    degrees = ddmm // 100
+    degrees += (ddmm - degrees * 100) / 60.0
+    return -degrees if hemisphere in ('S', 'W') else degrees
+
+def parse_nmea_sentence(line: str) -> dict | None:
+    """Parse one NMEA sentence into the GPS fields it updates (None if nothing to update).
+    Only GGA/RMC/VTG are consumed, so fields are read straight from the split line.
+    Raises ValueError/IndexError on malformed sentences.
+    """
+    if not nmea_checksum_ok(line):
+        raise ValueError("NMEA checksum mismatch")
+    
+    star = line.rfind('*')
+    parts = (line[:star] if star >= 0 else line).split(',')
+    sentence_type = parts[0][-3:]  # 'GGA', 'RMC', 'VTG', etc.
+    update = {}
+    
+    # GGA - position fix (handles both $GPGGA and $GNGGA)
+    if sentence_type == 'GGA':
+        lat = nmea_coord(parts[2], parts[3])
+        lon = nmea_coord(parts[4], parts[5])
+        if lat and lon:
+            update['lat'] = lat
+            update['lon'] = lon
+            update['fix'] = int(parts[6] or 0) > 0
+    
+    # RMC - recommended minimum (has speed and heading)
+    elif sentence_type == 'RMC':
+        if parts[2] == 'A':  # Active/valid
+            update['fix'] = True
+            lat = nmea_coord(parts[3], parts[4])
+            lon = nmea_coord(parts[5], parts[6])
+            if lat and lon:
+                update['lat'] = lat
+                update['lon'] = lon
+            if parts[7] and float(parts[7]):
+                # Convert knots to km/h
+                update['speed'] = float(parts[7]) * 1.852
+            if parts[8] and float(parts[8]):
+                update['heading'] = float(parts[8])
+        else:
+            update['fix'] = False
+    
+    # VTG - track and speed
+    elif sentence_type == 'VTG':
+        if len(parts) > 7 and parts[7] and float(parts[7]):
+            update['speed'] = float(parts[7])
+        if parts[1] and float(parts[1]):
+            update['heading'] = float(parts[1])
+    
+    return update or None
 
-async def gps_reader_loop():
-    """Read GPS data from serial port in background"""
+def apply_gps_update(update: dict):
+    """Apply parsed GPS fields to global state (runs on the event loop thread)"""
     global gps_lat, gps_lon, gps_speed, gps_heading, gps_fix
     
+    gps_lat = update.get('lat', gps_lat)
+    gps_lon = update.get('lon', gps_lon)
+    gps_speed = update.get('speed', gps_speed)
+    gps_heading = update.get('heading', gps_heading)
+    gps_fix = update.get('fix', gps_fix)
+
+def gps_reader_thread(loop: asyncio.AbstractEventLoop):
+    """Read and parse GPS data on a dedicated thread.
+    Blocking serial reads and NMEA parsing stay off the event loop;
+    parsed fields are handed to the loop via call_soon_threadsafe.
+    """
     ser = None
     while True:
         try:
@@ -850,7 +1038,7 @@ async def gps_reader_loop():
                 logger.info(f"GPS serial port opened: {GPS_PORT} @ {GPS_BAUD}")
             
             # Read line (blocking, but with timeout)
-            line = await asyncio.get_event_loop().run_in_executor(None, ser.readline)
+            line = ser.readline()
             
             if not line:
                 continue
@@ -859,40 +1047,12 @@ async def gps_reader_loop():
                 line = line.decode('ascii', errors='ignore').strip()
                 if not line.startswith('$'):
                     continue
-                    
-                msg = pynmea2.parse(line)
-                sentence_type = msg.sentence_type  # 'GGA', 'RMC', 'VTG', etc.
                 
-                # GGA - position fix (handles both $GPGGA and $GNGGA)
-                if sentence_type == 'GGA':
-                    if msg.latitude and msg.longitude:
-                        gps_lat = msg.latitude
-                        gps_lon = msg.longitude
-                        gps_fix = msg.gps_qual > 0
-                
-                # RMC - recommended minimum (has speed and heading)
-                elif sentence_type == 'RMC':
-                    if msg.status == 'A':  # Active/valid
-                        gps_fix = True
-                        if msg.latitude and msg.longitude:
-                            gps_lat = msg.latitude
-                            gps_lon = msg.longitude
-                        if msg.spd_over_grnd:
-                            # Convert knots to km/h
-                            gps_speed = msg.spd_over_grnd * 1.852
-                        if msg.true_course:
-                            gps_heading = msg.true_course
-                    else:
-                        gps_fix = False
-                
-                # VTG - track and speed
-                elif sentence_type == 'VTG':
-                    if hasattr(msg, 'spd_over_grnd_kmph') and msg.spd_over_grnd_kmph:
-                        gps_speed = msg.spd_over_grnd_kmph
-                    if hasattr(msg, 'true_track') and msg.true_track:
-                        gps_heading = msg.true_track
+                update = parse_nmea_sentence(line)
+                if update:
+                    loop.call_soon_threadsafe(apply_gps_update, update)
                         
-            except pynmea2.ParseError:
+            except (ValueError, IndexError):
                 pass  # Ignore malformed sentences
                 
         except serial.SerialException as e:
@@ -900,14 +1060,16 @@ async def gps_reader_loop():
             if ser:
                 ser.close()
                 ser = None
-            await asyncio.sleep(5)
+            time.sleep(5)
         except Exception as e:
             logger.error(f"GPS error: {e}")
-            await asyncio.sleep(1)
+            time.sleep(1)
 
 async def telemetry_broadcast_loop():
     """Broadcast telemetry at 10Hz, extended telemetry at 5Hz"""
+    loop = asyncio.get_running_loop()
     extended_counter = 0
+    next_tick = loop.time()
     while True:
         try:
             if race_state == "racing":
@@ -921,7 +1083,12 @@ async def telemetry_broadcast_loop():
                     extended_counter = 0
         except Exception as e:
             logger.error(f"Telemetry broadcast error: {e}", exc_info=True)
-        await asyncio.sleep(0.1)  # 10Hz
+        # 10Hz on a fixed schedule: the deadline accumulates so work time doesn't add drift
+        next_tick += 0.1
+        now = loop.time()
+        if next_tick < now:
+            next_tick = now  # Fell behind (e.g. loop stall) - don't burst to catch up
+        await asyncio.sleep(next_tick - now)
 
 
 # ----- IMU (BNO055) Reading -----
@@ -1135,12 +1302,9 @@ def blend_angles(a1: float, a2: float, t: float) -> float:
 
 def smooth_angle(current: float, target: float, alpha: float) -> float:
     """Low-pass filter for angles with wrap-around handling"""
-    # Calculate shortest angular difference
-    diff = math.atan2(
-        math.sin(math.radians(target - current)),
-        math.cos(math.radians(target - current))
-    )
-    return (current + alpha * math.degrees(diff)) % 360
+    # Shortest angular difference, wrapped to [-180, 180]
+    diff = math.remainder(target - current, 360.0)
+    return (current + alpha * diff) % 360
 
 
 # ----- Speed Fusion (GPS + Wheel RPM) -----
@@ -1272,12 +1436,15 @@ def fuse_speed():
 # ----- Token Validation -----
 
 def validate_token(token: str) -> bool:
-    """Validate HMAC-SHA256 signed token (same as Cloudflare relay)"""
-    if not token or len(token) != 24:
+    """Validate HMAC-SHA256 signed token (same as Cloudflare relay).
+    Checks run cheapest-first; the HMAC is only computed for well-formed, unexpired tokens.
+    """
+    # Tokens are 24 ASCII hex chars (also keeps compare_digest from raising on non-ASCII input)
+    if not token or len(token) != 24 or not token.isascii():
         return False
     
     # Check if token is revoked
-    if token in revoked_tokens:
+    if token in revoked_set:
         logger.warning("Token is revoked")
         return False
     
@@ -1290,16 +1457,13 @@ def validate_token(token: str) -> bool:
         return False
     
     # Check expiry
-    if time.time() > expiry:
-        logger.warning(f"Token expired: {expiry} < {time.time()}")
+    now = time.time()
+    if now > expiry:
+        logger.warning(f"Token expired: {expiry} < {now}")
         return False
     
     # Verify HMAC signature
-    expected = hmac.new(
-        TOKEN_SECRET.encode(),
-        expiry_hex.encode(),
-        hashlib.sha256
-    ).hexdigest()[:16]
+    expected = hmac.digest(TOKEN_SECRET_BYTES, expiry_hex.encode('ascii'), 'sha256')[:8].hex()
     
     if not hmac.compare_digest(signature, expected):
         logger.warning("Token signature mismatch")
@@ -1354,9 +1518,9 @@ def log_stability_interventions(orig_throttle, new_throttle, orig_steering, new_
     # LowSpeedTractionManager uses get_status() to check intervention
     if traction_ctrl:
         status = traction_ctrl.get_status()
-        if status['slip_detected']:
+        if status.slip_detected:
             intervening = True
-            reasons.append(f"traction:{status['phase']}(slip={status['slip_ratio']:.0%})")
+            reasons.append(f"traction:{status.phase}(slip={status.slip_ratio:.0%})")
     
     if steering_shaper:
         if steering_shaper.rate_limited:
@@ -1392,40 +1556,337 @@ def forward_to_esp32(message: bytes):
         return
     
     try:
-        udp_sock.sendto(message, (ESP32_IP, ESP32_PORT))
+        udp_transport.sendto(message)
     except Exception as e:
         logger.error(f"UDP send error: {e}")
 
-async def discover_esp32():
-    """Listen for ESP32 beacon broadcasts"""
-    global ESP32_IP
+async def connect_esp32(ip: str):
+    """Point the ESP32 UDP transport at a (new) IP.
+    A connected socket fixes the destination once, so per-packet sends carry no address.
+    """
+    global ESP32_IP, udp_transport
+    
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+        asyncio.DatagramProtocol, remote_addr=(ip, ESP32_PORT)
+    )
+    old_transport = udp_transport
+    udp_transport = transport
+    ESP32_IP = ip
+    if old_transport:
+        old_transport.close()
+
+class BeaconProtocol(asyncio.DatagramProtocol):
+    """Receives ESP32 beacon broadcasts and reconnects the ESP32 transport on IP change"""
     
+    def __init__(self):
+        self.pending_ip = None  # IP whose transport is being created
+    
+    def datagram_received(self, data, addr):
+        if data != b'ARRMA':
+            return
+        new_ip = addr[0]
+        if new_ip != ESP32_IP and new_ip != self.pending_ip:
+            self.pending_ip = new_ip
+            asyncio.create_task(self.connect(new_ip))
+    
+    async def connect(self, ip: str):
+        try:
+            await connect_esp32(ip)
+            logger.info(f"Discovered ESP32 at {ESP32_IP}")
+        except Exception as e:
+            logger.error(f"Beacon error: {e}")
+        finally:
+            if self.pending_ip == ip:
+                self.pending_ip = None
+
+async def discover_esp32():
+    """Listen for ESP32 beacon broadcasts (received by BeaconProtocol, no polling)"""
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
     sock.bind(('', BEACON_PORT))
-    sock.setblocking(False)
     
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(BeaconProtocol, sock=sock)
     logger.info(f"Listening for ESP32 beacon on port {BEACON_PORT}")
+    return transport
+
+# ----- DataChannel Message Handlers -----
+
+# Packet format: seq(2) + cmd(1) + payload
+# Each handler takes (channel, message) and is looked up by cmd in MESSAGE_HANDLERS
+
+def read_toggle_flag(message: bytes) -> bool:
+    """Read the enabled flag from a toggle message (seq(2) + cmd(1) + enabled(1))"""
+    return TOGGLE_STRUCT.unpack_from(message)[2] == 1
+
+def handle_ping_message(channel, message: bytes):
+    """PING - echo back as PONG (keep seq and timestamp, change cmd to PONG)"""
+    pong = bytearray(message)
+    pong[2] = CMD_PONG
+    channel.send(bytes(pong))  # aiortc only accepts str/bytes
+
+def handle_ctrl_message(channel, message: bytes):
+    """CTRL - run controller chain and forward to ESP32 only if racing"""
+    global current_throttle, current_steering
     
-    loop = asyncio.get_event_loop()
+    # Update telemetry state (throttle/steering)
+    if len(message) >= CTRL_STRUCT.size:
+        seq, _, current_throttle, current_steering = CTRL_STRUCT.unpack_from(message)
+    else:
+        seq = MSG_HEADER_STRUCT.unpack_from(message)[0]
     
-    while True:
-        try:
-            data, addr = await loop.sock_recvfrom(sock, 1024)
-            if data == b'ARRMA':
-                new_ip = addr[0]
-                if ESP32_IP != new_ip:
-                    ESP32_IP = new_ip
-                    logger.info(f"Discovered ESP32 at {ESP32_IP}")
-        except BlockingIOError:
-            await asyncio.sleep(0.1)
-        except Exception as e:
-            logger.error(f"Beacon error: {e}")
-            await asyncio.sleep(1)
+    if race_state != "racing":
+        return  # Silently drop control commands (race not active)
+    
+    limited_throttle = current_throttle
+    shaped_steering = current_steering
+    
+    # Update ESC state tracker for ABS (pass forward accel for direction hint)
+    esc_state = "neutral"
+    if throttle_tracker:
+        esc_state = throttle_tracker.update(
+            current_throttle, fused_speed, imu_forward_accel
+        )
+    
+    # Get grip multiplier from surface adaptation
+    grip_multiplier = 1.0
+    if surface_adapt and surface_adapt_enabled:
+        grip_multiplier = surface_adapt.get_traction_threshold_multiplier()
+    
+    # === CONTROLLER CHAIN ===
+    # Order: SteeringShaper → HillHold → LowSpeedTraction → 
+    #        Stability → SlipWatchdog → ABS → CoastControl
+    
+    # 1. Apply steering shaper if enabled (latency-aware steering)
+    if steering_shaper and stability_enabled:
+        shaped_steering = steering_shaper.update(
+            steering_input=current_steering,
+            speed=fused_speed,
+            yaw_rate=imu_yaw_rate
+        )
+    
+    # 2. Apply hill hold if enabled (holds car on slopes)
+    if hill_hold_ctrl and hill_hold_enabled:
+        limited_throttle = hill_hold_ctrl._update(
+            pitch_deg=imu_pitch,
+            speed_kmh=fused_speed,
+            throttle_input=limited_throttle,
+            timestamp=time.monotonic()
+        )
+    
+    # 3. Apply traction control if enabled (wheelspin prevention)
+    if traction_ctrl and traction_enabled and limited_throttle > 0:
+        limited_throttle = traction_ctrl.apply_to_throttle(
+            limited_throttle,
+            yaw_rate=imu_yaw_rate,
+            grip_multiplier=grip_multiplier
+        )
+    
+    # 4. Apply stability control if enabled (yaw-rate limiting)
+    if stability_ctrl and stability_enabled and limited_throttle > 0:
+        limited_throttle = stability_ctrl.apply_to_throttle(limited_throttle)
+    
+    # 5. Apply slip angle watchdog if enabled (drift/slide recovery)
+    if slip_watchdog and stability_enabled and limited_throttle > 0:
+        limited_throttle = slip_watchdog.apply_to_throttle(limited_throttle)
+    
+    # 6. Apply ABS if enabled (prevents wheel lockup during braking)
+    if abs_ctrl and abs_enabled and limited_throttle < 0:
+        limited_throttle = abs_ctrl.update(
+            wheel_speed=wheel_speed,
+            vehicle_speed=fused_speed,
+            imu_forward_accel=imu_forward_accel,
+            throttle_input=limited_throttle,
+            esc_state=esc_state,
+            timestamp_ms=int(time.time() * 1000)
+        )
+    
+    # 7. Apply coast control if enabled (smooths throttle release)
+    if coast_ctrl and coast_enabled:
+        limited_throttle = coast_ctrl.update(
+            throttle_input=limited_throttle,
+            speed_kmh=fused_speed,
+            timestamp=time.time()
+        )
+    
+    # Log interventions for tuning (rate-limited to avoid spam)
+    log_stability_interventions(
+        current_throttle, limited_throttle,
+        current_steering, shaped_steering
+    )
+    
+    # Repack if throttle or steering was modified
+    if limited_throttle != current_throttle or shaped_steering != current_steering:
+        message = CTRL_STRUCT.pack(seq, CMD_CTRL, limited_throttle, shaped_steering)
+    
+    forward_to_esp32(message)
+
+def handle_status_message(channel, message: bytes):
+    """STATUS - browser reporting state"""
+    global video_connected, player_ready
+    
+    if len(message) < STATUS_STRUCT.size:
+        return
+    _, _, sub_cmd, value_byte = STATUS_STRUCT.unpack_from(message)
+    value = value_byte == 1
+    if sub_cmd == STATUS_VIDEO:
+        video_connected = value
+        logger.info(f"Video status: {'connected' if video_connected else 'disconnected'}")
+    elif sub_cmd == STATUS_READY:
+        player_ready = value
+        logger.info(f"Player ready: {player_ready}")
+
+def handle_turbo_message(channel, message: bytes):
+    """TURBO - player toggling turbo mode"""
+    global turbo_mode
+    
+    if race_state != "racing" or len(message) < TOGGLE_STRUCT.size:
+        return  # Ignore car controls before race starts
+    turbo_mode = read_toggle_flag(message)
+    logger.info(f"Turbo mode set by player: {turbo_mode}")
+    
+    # Forward to ESP32
+    send_turbo_to_esp32()
+    
+    # Send updated config back to confirm
+    send_config()
+
+def handle_traction_message(channel, message: bytes):
+    """TRACTION - player toggling traction control"""
+    global traction_enabled
+    
+    if race_state != "racing" or len(message) < TOGGLE_STRUCT.size:
+        return  # Ignore car controls before race starts
+    traction_enabled = read_toggle_flag(message)
+    if traction_ctrl:
+        traction_ctrl.enabled = traction_enabled
+        if not traction_enabled:
+            traction_ctrl.reset()  # Clear any active slip state
+    logger.info(f"Traction control set by player: {traction_enabled}")
+    # Send updated config back to confirm
+    send_config()
+
+def handle_stability_message(channel, message: bytes):
+    """STABILITY - player toggling yaw-rate control (also slip watchdog and steering shaper)"""
+    global stability_enabled
+    
+    if race_state != "racing" or len(message) < TOGGLE_STRUCT.size:
+        return  # Ignore car controls before race starts
+    stability_enabled = read_toggle_flag(message)
+    if stability_ctrl:
+        stability_ctrl.enabled = stability_enabled
+        if not stability_enabled:
+            stability_ctrl.reset()  # Clear any active intervention
+    if slip_watchdog:
+        slip_watchdog.enabled = stability_enabled
+        if not stability_enabled:
+            slip_watchdog.reset()
+    if steering_shaper:
+        steering_shaper.enabled = stability_enabled
+        if not stability_enabled:
+            steering_shaper.reset()
+    logger.info(f"Stability control set by player: {stability_enabled}")
+    # Send updated config back to confirm
+    send_config()
+
+def handle_headlight_message(channel, message: bytes):
+    """HEADLIGHT - player toggling headlights"""
+    global headlight_on
+    
+    if race_state != "racing" or len(message) < TOGGLE_STRUCT.size:
+        return  # Ignore car controls before race starts
+    headlight_on = read_toggle_flag(message)
+    GPIO.output(HEADLIGHT_GPIO_PIN, GPIO.HIGH if headlight_on else GPIO.LOW)
+    logger.info(f"Headlight set by player: {'ON' if headlight_on else 'OFF'}")
+
+def handle_abs_message(channel, message: bytes):
+    """ABS - player toggling ABS"""
+    global abs_enabled
+    
+    if race_state != "racing" or len(message) < TOGGLE_STRUCT.size:
+        return  # Ignore car controls before race starts
+    abs_enabled = read_toggle_flag(message)
+    if abs_ctrl:
+        abs_ctrl.enabled = abs_enabled
+        if not abs_enabled:
+            abs_ctrl.reset()
+    if throttle_tracker and not abs_enabled:
+        throttle_tracker.reset()
+    logger.info(f"ABS set by player: {abs_enabled}")
+    send_config()
+
+def handle_hill_hold_message(channel, message: bytes):
+    """HILL_HOLD - player toggling hill hold"""
+    global hill_hold_enabled
+    
+    if race_state != "racing" or len(message) < TOGGLE_STRUCT.size:
+        return  # Ignore car controls before race starts
+    hill_hold_enabled = read_toggle_flag(message)
+    if hill_hold_ctrl:
+        hill_hold_ctrl.enabled = hill_hold_enabled
+        if not hill_hold_enabled:
+            hill_hold_ctrl.reset()
+    logger.info(f"Hill hold set by player: {hill_hold_enabled}")
+    send_config()
+
+def handle_coast_message(channel, message: bytes):
+    """COAST - player toggling coast control"""
+    global coast_enabled
+    
+    if race_state != "racing" or len(message) < TOGGLE_STRUCT.size:
+        return  # Ignore car controls before race starts
+    coast_enabled = read_toggle_flag(message)
+    if coast_ctrl:
+        coast_ctrl.enabled = coast_enabled
+        if not coast_enabled:
+            coast_ctrl.reset()
+    logger.info(f"Coast control set by player: {coast_enabled}")
+    send_config()
+
+def handle_surface_adapt_message(channel, message: bytes):
+    """SURFACE_ADAPT - player toggling surface adaptation"""
+    global surface_adapt_enabled
+    
+    if race_state != "racing" or len(message) < TOGGLE_STRUCT.size:
+        return  # Ignore car controls before race starts
+    surface_adapt_enabled = read_toggle_flag(message)
+    if surface_adapt:
+        surface_adapt.enabled = surface_adapt_enabled
+        if not surface_adapt_enabled:
+            surface_adapt.reset()
+    logger.info(f"Surface adaptation set by player: {surface_adapt_enabled}")
+    send_config()
+
+# Command byte -> handler (unknown commands are ignored)
+MESSAGE_HANDLERS = {
+    CMD_PING: handle_ping_message,
+    CMD_CTRL: handle_ctrl_message,
+    CMD_STATUS: handle_status_message,
+    CMD_TURBO: handle_turbo_message,
+    CMD_TRACTION: handle_traction_message,
+    CMD_STABILITY: handle_stability_message,
+    CMD_HEADLIGHT: handle_headlight_message,
+    CMD_ABS: handle_abs_message,
+    CMD_HILL_HOLD: handle_hill_hold_message,
+    CMD_COAST: handle_coast_message,
+    CMD_SURFACE_ADAPT: handle_surface_adapt_message,
+}
 
 # ----- WebRTC Signaling -----
 
+async def wait_ice_gathering(pc: RTCPeerConnection):
+    """Wait until ICE gathering completes (event-driven, no polling)"""
+    if pc.iceGatheringState == "complete":
+        return
+    gathered = asyncio.get_running_loop().create_future()
+    
+    @pc.on("icegatheringstatechange")
+    def on_ice_gathering_state_change():
+        if pc.iceGatheringState == "complete" and not gathered.done():
+            gathered.set_result(None)
+    
+    await gathered
+
 async def handle_offer(request):
     """Handle WebRTC signaling (WHIP-like POST with SDP offer)"""
     global pc, control_channel, current_player_token
@@ -1434,7 +1895,7 @@ async def handle_offer(request):
     client_ip = get_client_ip(request)
     if not check_rate_limit(client_ip):
         logger.warning(f"Rate limit exceeded for {client_ip}")
-        return web.Response(status=429, text='Too many requests', headers=CORS_HEADERS)
+        return web.Response(status=429, text='Too many requests')
     
     # Validate token
     token = request.query.get('token', '')
@@ -1478,7 +1939,7 @@ async def handle_offer(request):
         # Reset speed variables on reconnect (when first client connects)
         was_disconnected = len(data_channels) == 0
         control_channel = channel
-        data_channels.append(channel)  # Track for telemetry broadcast
+        add_data_channel(channel)  # Track for telemetry broadcast
         
         if was_disconnected:
             imu_integrated_speed = 0.0
@@ -1494,235 +1955,21 @@ async def handle_offer(request):
         # Send current race state (for reconnection during race)
         send_race_state()
         
-        ctrl_count = [0]  # Use list to allow mutation in nested function
-        
         @channel.on("message")
         def on_message(message):
-            global race_state, current_throttle, current_steering
-            global traction_ctrl, traction_enabled
-            global stability_ctrl, stability_enabled
-            global abs_ctrl, abs_enabled, throttle_tracker
-            global hill_hold_ctrl, hill_hold_enabled
-            global coast_ctrl, coast_enabled
-            global surface_adapt, surface_adapt_enabled
-            global video_connected, player_ready, turbo_mode
-            # New packet format: seq(2) + cmd(1) + payload
-            if isinstance(message, bytes) and len(message) >= 3:
-                seq = struct.unpack('<H', message[0:2])[0]
-                cmd = message[2]
-                
-                if cmd == CMD_PING:  # PING - echo back as PONG
-                    pong = message[0:2] + bytes([CMD_PONG]) + message[3:]  # Keep seq, change cmd to PONG
-                    channel.send(pong)
-                elif cmd == CMD_CTRL:  # CTRL - forward to ESP32 only if racing
-                    # Update telemetry state (throttle/steering)
-                    if len(message) >= 7:
-                        current_throttle, current_steering = struct.unpack('<hh', message[3:7])
-                    
-                    if race_state == "racing":
-                        ctrl_count[0] += 1
-                        limited_throttle = current_throttle
-                        shaped_steering = current_steering
-                        
-                        # Update ESC state tracker for ABS (pass forward accel for direction hint)
-                        esc_state = "neutral"
-                        if throttle_tracker:
-                            esc_state = throttle_tracker.update(
-                                current_throttle, fused_speed, imu_forward_accel
-                            )
-                        
-                        # Get grip multiplier from surface adaptation
-                        grip_multiplier = 1.0
-                        if surface_adapt and surface_adapt_enabled:
-                            grip_multiplier = surface_adapt.get_traction_threshold_multiplier()
-                        
-                        # === CONTROLLER CHAIN ===
-                        # Order: SteeringShaper → HillHold → LowSpeedTraction → 
-                        #        Stability → SlipWatchdog → ABS → CoastControl
-                        
-                        # 1. Apply steering shaper if enabled (latency-aware steering)
-                        if steering_shaper and stability_enabled:
-                            shaped_steering = steering_shaper.update(
-                                steering_input=current_steering,
-                                speed=fused_speed,
-                                yaw_rate=imu_yaw_rate
-                            )
-                        
-                        # 2. Apply hill hold if enabled (holds car on slopes)
-                        if hill_hold_ctrl and hill_hold_enabled:
-                            limited_throttle = hill_hold_ctrl.update(
-                                pitch_deg=imu_pitch,
-                                speed_kmh=fused_speed,
-                                throttle_input=limited_throttle,
-                                timestamp=time.time()
-                            )
-                        
-                        # 3. Apply traction control if enabled (wheelspin prevention)
-                        if traction_ctrl and traction_enabled and limited_throttle > 0:
-                            limited_throttle = traction_ctrl.apply_to_throttle(
-                                limited_throttle,
-                                yaw_rate=imu_yaw_rate,
-                                grip_multiplier=grip_multiplier
-                            )
-                        
-                        # 4. Apply stability control if enabled (yaw-rate limiting)
-                        if stability_ctrl and stability_enabled and limited_throttle > 0:
-                            limited_throttle = stability_ctrl.apply_to_throttle(limited_throttle)
-                        
-                        # 5. Apply slip angle watchdog if enabled (drift/slide recovery)
-                        if slip_watchdog and stability_enabled and limited_throttle > 0:
-                            limited_throttle = slip_watchdog.apply_to_throttle(limited_throttle)
-                        
-                        # 6. Apply ABS if enabled (prevents wheel lockup during braking)
-                        if abs_ctrl and abs_enabled and limited_throttle < 0:
-                            limited_throttle = abs_ctrl.update(
-                                wheel_speed=wheel_speed,
-                                vehicle_speed=fused_speed,
-                                imu_forward_accel=imu_forward_accel,
-                                throttle_input=limited_throttle,
-                                esc_state=esc_state,
-                                timestamp_ms=int(time.time() * 1000)
-                            )
-                        
-                        # 7. Apply coast control if enabled (smooths throttle release)
-                        if coast_ctrl and coast_enabled:
-                            limited_throttle = coast_ctrl.update(
-                                throttle_input=limited_throttle,
-                                speed_kmh=fused_speed,
-                                timestamp=time.time()
-                            )
-                        
-                        # Log interventions for tuning (rate-limited to avoid spam)
-                        log_stability_interventions(
-                            current_throttle, limited_throttle,
-                            current_steering, shaped_steering
-                        )
-                        
-                        # Repack if throttle or steering was modified
-                        if limited_throttle != current_throttle or shaped_steering != current_steering:
-                            message = struct.pack('<HBhh', seq, CMD_CTRL, limited_throttle, shaped_steering)
-                        
-                        forward_to_esp32(message)
-                    # else: silently drop control commands (race not active)
-                elif cmd == CMD_STATUS:  # STATUS - browser reporting state
-                    if len(message) >= 5:
-                        sub_cmd = message[3]
-                        value = message[4] == 1
-                        if sub_cmd == STATUS_VIDEO:
-                            video_connected = value
-                            logger.info(f"Video status: {'connected' if video_connected else 'disconnected'}")
-                        elif sub_cmd == STATUS_READY:
-                            player_ready = value
-                            logger.info(f"Player ready: {player_ready}")
-                elif cmd == CMD_TURBO:  # TURBO - player toggling turbo mode
-                    if race_state != "racing":
-                        pass  # Ignore car controls before race starts
-                    elif len(message) >= 4:
-                        new_turbo = message[3] == 1
-                        turbo_mode = new_turbo
-                        logger.info(f"Turbo mode set by player: {turbo_mode}")
-                        
-                        # Forward to ESP32
-                        send_turbo_to_esp32()
-                        
-                        # Send updated config back to confirm
-                        send_config()
-                elif cmd == CMD_TRACTION:  # TRACTION - player toggling traction control
-                    if race_state != "racing":
-                        pass  # Ignore car controls before race starts
-                    elif len(message) >= 4:
-                        traction_enabled = message[3] == 1
-                        if traction_ctrl:
-                            traction_ctrl.enabled = traction_enabled
-                            if not traction_enabled:
-                                traction_ctrl.reset()  # Clear any active slip state
-                        logger.info(f"Traction control set by player: {traction_enabled}")
-                        # Send updated config back to confirm
-                        send_config()
-                elif cmd == CMD_STABILITY:  # STABILITY - player toggling yaw-rate control
-                    if race_state != "racing":
-                        pass  # Ignore car controls before race starts
-                    elif len(message) >= 4:
-                        stability_enabled = message[3] == 1
-                        if stability_ctrl:
-                            stability_ctrl.enabled = stability_enabled
-                            if not stability_enabled:
-                                stability_ctrl.reset()  # Clear any active intervention
-                        if slip_watchdog:
-                            slip_watchdog.enabled = stability_enabled
-                            if not stability_enabled:
-                                slip_watchdog.reset()
-                        if steering_shaper:
-                            steering_shaper.enabled = stability_enabled
-                            if not stability_enabled:
-                                steering_shaper.reset()
-                        logger.info(f"Stability control set by player: {stability_enabled}")
-                        # Send updated config back to confirm
-                        send_config()
-                elif cmd == CMD_HEADLIGHT:  # HEADLIGHT - player toggling headlights
-                    if race_state != "racing":
-                        pass  # Ignore car controls before race starts
-                    elif len(message) >= 4:
-                        global headlight_on
-                        headlight_on = message[3] == 1
-                        GPIO.output(HEADLIGHT_GPIO_PIN, GPIO.HIGH if headlight_on else GPIO.LOW)
-                        logger.info(f"Headlight set by player: {'ON' if headlight_on else 'OFF'}")
-                elif cmd == CMD_ABS:  # ABS - player toggling ABS
-                    if race_state != "racing":
-                        pass  # Ignore car controls before race starts
-                    elif len(message) >= 4:
-                        abs_enabled = message[3] == 1
-                        if abs_ctrl:
-                            abs_ctrl.enabled = abs_enabled
-                            if not abs_enabled:
-                                abs_ctrl.reset()
-                        if throttle_tracker and not abs_enabled:
-                            throttle_tracker.reset()
-                        logger.info(f"ABS set by player: {abs_enabled}")
-                        send_config()
-                elif cmd == CMD_HILL_HOLD:  # HILL_HOLD - player toggling hill hold
-                    if race_state != "racing":
-                        pass  # Ignore car controls before race starts
-                    elif len(message) >= 4:
-                        hill_hold_enabled = message[3] == 1
-                        if hill_hold_ctrl:
-                            hill_hold_ctrl.enabled = hill_hold_enabled
-                            if not hill_hold_enabled:
-                                hill_hold_ctrl.reset()
-                        logger.info(f"Hill hold set by player: {hill_hold_enabled}")
-                        send_config()
-                elif cmd == CMD_COAST:  # COAST - player toggling coast control
-                    if race_state != "racing":
-                        pass  # Ignore car controls before race starts
-                    elif len(message) >= 4:
-                        coast_enabled = message[3] == 1
-                        if coast_ctrl:
-                            coast_ctrl.enabled = coast_enabled
-                            if not coast_enabled:
-                                coast_ctrl.reset()
-                        logger.info(f"Coast control set by player: {coast_enabled}")
-                        send_config()
-                elif cmd == CMD_SURFACE_ADAPT:  # SURFACE_ADAPT - player toggling surface adaptation
-                    if race_state != "racing":
-                        pass  # Ignore car controls before race starts
-                    elif len(message) >= 4:
-                        surface_adapt_enabled = message[3] == 1
-                        if surface_adapt:
-                            surface_adapt.enabled = surface_adapt_enabled
-                            if not surface_adapt_enabled:
-                                surface_adapt.reset()
-                        logger.info(f"Surface adaptation set by player: {surface_adapt_enabled}")
-                        send_config()
+            # Packet format: seq(2) + cmd(1) + payload
+            if isinstance(message, bytes) and len(message) >= MSG_HEADER_STRUCT.size:
+                handler = MESSAGE_HANDLERS.get(MSG_HEADER_STRUCT.unpack_from(message)[1])
+                if handler:
+                    handler(channel, message)
         
         @channel.on("close")
         def on_close():
             global control_channel, data_channels
-            if channel in data_channels:
-                data_channels.remove(channel)
+            remove_data_channel(channel)
             if control_channel == channel:
                 control_channel = None
             logger.info(f"DataChannel '{channel.label}' closed (remaining: {len(data_channels)})")
-            logger.info(f"DataChannel '{channel.label}' closed")
     
     @pc.on("connectionstatechange")
     async def on_connectionstatechange():
@@ -1748,34 +1995,18 @@ async def handle_offer(request):
     
     # Wait for ICE gathering to complete
     logger.info("Waiting for ICE gathering...")
-    while pc.iceGatheringState != "complete":
-        await asyncio.sleep(0.1)
+    await wait_ice_gathering(pc)
     logger.info("ICE gathering complete")
     
     return web.Response(
         text=pc.localDescription.sdp,
-        content_type="application/sdp",
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "POST, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type",
-        }
-    )
-
-async def handle_options(request):
-    """Handle CORS preflight requests"""
-    return web.Response(
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "POST, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type",
-        }
+        content_type="application/sdp"
     )
 
 # ----- Telemetry Subscriber Endpoint -----
 
 # Track telemetry subscriber connections (separate from main control)
-telemetry_subscribers = []  # List of (pc, datachannel) tuples
+telemetry_subscribers = {}  # id(pc) -> (pc, datachannel)
 
 async def handle_telemetry_offer(request):
     """Handle WebRTC signaling for telemetry subscribers (read-only, doesn't kick browser)"""
@@ -1785,7 +2016,7 @@ async def handle_telemetry_offer(request):
     client_ip = get_client_ip(request)
     if not check_rate_limit(client_ip):
         logger.warning(f"Rate limit exceeded for telemetry from {client_ip}")
-        return web.Response(status=429, text='Too many requests', headers=CORS_HEADERS)
+        return web.Response(status=429, text='Too many requests')
     
     # Validate token
     token = request.query.get('token', '')
@@ -1814,14 +2045,12 @@ async def handle_telemetry_offer(request):
         nonlocal sub_channel
         global data_channels
         sub_channel = channel
-        data_channels.append(channel)  # Add to broadcast list
+        add_data_channel(channel)  # Add to broadcast list
         logger.info(f"Telemetry subscriber DataChannel '{channel.label}' opened (total subscribers: {len(data_channels)})")
         
         @channel.on("close")
         def on_close():
-            global data_channels
-            if channel in data_channels:
-                data_channels.remove(channel)
+            remove_data_channel(channel)
             logger.info(f"Telemetry subscriber DataChannel closed (remaining: {len(data_channels)})")
     
     @sub_pc.on("connectionstatechange")
@@ -1830,10 +2059,10 @@ async def handle_telemetry_offer(request):
         logger.info(f"Telemetry subscriber connection state: {sub_pc.connectionState}")
         if sub_pc.connectionState in ("failed", "closed", "disconnected"):
             # Clean up this subscriber
-            if sub_channel and sub_channel in data_channels:
-                data_channels.remove(sub_channel)
-            # Remove from subscribers list
-            telemetry_subscribers[:] = [(p, c) for p, c in telemetry_subscribers if p != sub_pc]
+            if sub_channel:
+                remove_data_channel(sub_channel)
+            # Remove from subscribers
+            telemetry_subscribers.pop(id(sub_pc), None)
             if sub_pc.connectionState != "closed":
                 await sub_pc.close()
     
@@ -1848,95 +2077,138 @@ async def handle_telemetry_offer(request):
     
     # Wait for ICE gathering
     logger.info("Telemetry subscriber: waiting for ICE gathering...")
-    while sub_pc.iceGatheringState != "complete":
-        await asyncio.sleep(0.1)
+    await wait_ice_gathering(sub_pc)
     logger.info("Telemetry subscriber: ICE gathering complete")
     
     # Track this subscriber
-    telemetry_subscribers.append((sub_pc, sub_channel))
+    telemetry_subscribers[id(sub_pc)] = (sub_pc, sub_channel)
     
     return web.Response(
         text=sub_pc.localDescription.sdp,
-        content_type="application/sdp",
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "POST, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type",
-        }
+        content_type="application/sdp"
     )
 
 # ----- Health Check -----
 
-async def handle_health(request):
-    """Health check endpoint - requires valid token to access detailed info"""
-    # Validate token for detailed health info
-    token = request.query.get('token', '')
-    has_valid_token = validate_token(token)
-    
+def json_bytes(payload) -> bytes:
+    """Encode payload as JSON bytes (orjson if available, stdlib json otherwise)"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+# Rendered health JSON is cached for one telemetry tick, so dashboards polling
+# several times per second don't re-serialize the whole state on every request
+HEALTH_CACHE_TTL = 0.1  # seconds (telemetry tick)
+health_cache = {}  # has_valid_token -> (monotonic timestamp, JSON bytes)
+
+def build_health_payload(full: bool) -> dict:
+    """Build health check payload (basic without token, full state with token)"""
     # Basic health response (always available, no sensitive data)
-    if not has_valid_token:
-        return web.json_response(
-            {
-                "status": "ok",
-                "connected": pc is not None and pc.connectionState == "connected",
-            },
-            headers=CORS_HEADERS
-        )
+    if not full:
+        return {
+            "status": "ok",
+            "connected": pc is not None and pc.connectionState == "connected",
+        }
     
     # Full health response (requires valid token)
-    # Get traction control status
-    tc_status = traction_ctrl.get_status() if traction_ctrl else {"enabled": False}
+    # Get traction control status (raw snapshot, rounded here for the JSON)
+    if traction_ctrl:
+        status = traction_ctrl.get_status()
+        tc_status = status._replace(
+            slip_ratio=round(status.slip_ratio, 3),
+            throttle_multiplier=round(status.throttle_multiplier, 2),
+            estimated_speed_kmh=round(status.estimated_speed_kmh, 1),
+            wheel_accel=round(status.wheel_accel, 2),
+            vehicle_accel=round(status.vehicle_accel, 2),
+            current_threshold=round(status.current_threshold, 3),
+        )._asdict()
+    else:
+        tc_status = {"enabled": False}
     
     # Get direction estimator status
     dir_status = direction_est.get_status() if direction_est else {
         "direction": "stopped", "signed_speed": 0.0, "confidence": 0.0
     }
     
-    return web.json_response(
-        {
-            "status": "ok",
-            "connected": pc is not None and pc.connectionState == "connected",
-            "channel_open": control_channel is not None and control_channel.readyState == "open",
-            "video_connected": video_connected,
-            "player_ready": player_ready,
-            "turbo_mode": turbo_mode,
-            "speed": {
-                "fused_kmh": round(fused_speed, 2),
-                "gps_kmh": round(gps_speed, 2),
-                "wheel_kmh": round(wheel_speed, 2),
-                "wheel_rpm": round(wheel_rpm, 1),
-                "wheel_distance_m": round(wheel_distance, 2),
-                "signed_kmh": round(dir_status['signed_speed'], 2),
-                "direction": dir_status['direction']
-            },
-            "gps": {
-                "fix": gps_fix,
-                "lat": gps_lat,
-                "lon": gps_lon,
-                "heading": round(gps_heading, 1)
-            },
-            "imu": {
-                "valid": imu_valid,
-                "heading": round(imu_heading, 1),
-                "blended_heading": round(blended_heading, 1),
-                "yaw_rate": round(imu_yaw_rate, 1),
-                "forward_accel": round(imu_forward_accel, 2),
-                "lateral_accel": round(imu_lateral_accel, 2),
-                "calibration": imu_calibration
-            },
-            "traction_control": tc_status,
-            "direction_estimator": dir_status
+    return {
+        "status": "ok",
+        "connected": pc is not None and pc.connectionState == "connected",
+        "channel_open": control_channel is not None and control_channel.readyState == "open",
+        "video_connected": video_connected,
+        "player_ready": player_ready,
+        "turbo_mode": turbo_mode,
+        "speed": {
+            "fused_kmh": fused_speed,
+            "gps_kmh": gps_speed,
+            "wheel_kmh": wheel_speed,
+            "wheel_rpm": wheel_rpm,
+            "wheel_distance_m": wheel_distance,
+            "signed_kmh": dir_status['signed_speed'],
+            "direction": dir_status['direction']
         },
-        headers={"Access-Control-Allow-Origin": "*"}
-    )
+        "gps": {
+            "fix": gps_fix,
+            "lat": gps_lat,
+            "lon": gps_lon,
+            "heading": gps_heading
+        },
+        "imu": {
+            "valid": imu_valid,
+            "heading": imu_heading,
+            "blended_heading": blended_heading,
+            "yaw_rate": imu_yaw_rate,
+            "forward_accel": imu_forward_accel,
+            "lateral_accel": imu_lateral_accel,
+            "calibration": imu_calibration
+        },
+        "traction_control": tc_status,
+        "direction_estimator": dir_status
+    }
+
+async def handle_health(request):
+    """Health check endpoint - requires valid token to access detailed info"""
+    # Validate token for detailed health info
+    token = request.query.get('token', '')
+    has_valid_token = validate_token(token)
+    
+    now = time.monotonic()  # Immune to NTP steps (the Pi has no RTC)
+    cached = health_cache.get(has_valid_token)
+    if cached and now - cached[0] < HEALTH_CACHE_TTL:
+        body = cached[1]
+    else:
+        body = json_bytes(build_health_payload(has_valid_token))
+        health_cache[has_valid_token] = (now, body)
+    
+    return web.Response(body=body, content_type="application/json")
 
 # ----- Admin Interface -----
 
-CORS_HEADERS = {
+# Preflight headers, built once as a read-only CIMultiDict (aiohttp's own header type,
+# so copying them into a response skips per-key case-insensitive conversion)
+CORS_HEADERS = CIMultiDictProxy(CIMultiDict({
     "Access-Control-Allow-Origin": "*",
     "Access-Control-Allow-Methods": "POST, GET, OPTIONS",
     "Access-Control-Allow-Headers": "Content-Type, X-Admin-Password",
-}
+}))
+
+# Prebuilt JSON bodies for fixed admin responses (encoded once at startup)
+RESP_OK = json_bytes({"success": True})
+RESP_UNAUTHORIZED = json_bytes({"success": False, "error": "Unauthorized"})
+RESP_NO_PLAYER = json_bytes({"success": False, "error": "No player connected"})
+RESP_RACE_IN_PROGRESS = json_bytes({"success": False, "error": "Race already in progress"})
+
+def admin_response(body: bytes, status: int = 200) -> web.Response:
+    """Build a JSON admin response from encoded bytes (CORS origin added by cors_middleware)"""
+    return web.Response(body=body, status=status, content_type="application/json")
+
+@web.middleware
+async def cors_middleware(request, handler):
+    """Answer CORS preflight for every route and allow cross-origin reads of all responses"""
+    if request.method == "OPTIONS":
+        return web.Response(status=204, headers=CORS_HEADERS)  # Preflight needs no body
+    response = await handler(request)
+    response.headers.setdefault("Access-Control-Allow-Origin", "*")
+    return response
 
 def check_admin_auth(request) -> bool:
     """Validate admin password from X-Admin-Password header.
@@ -1998,30 +2270,43 @@ def send_race_command(sub_cmd: int, payload: bytes = b''):
     
     # Format: seq(2) + cmd(1) + sub_cmd(1) + payload
     # Use seq=0 for server-initiated messages
-    message = struct.pack('<HBB', 0, CMD_RACE, sub_cmd) + payload
+    message = RACE_STRUCT.pack(0, CMD_RACE, sub_cmd) + payload
     control_channel.send(message)
     logger.info(f"Sent race command: sub_cmd={sub_cmd}")
     return True
 
+# Last config sent, to skip redundant sends on idempotent toggles.
+# Keyed on the channel too, so a new browser connection always gets a fresh copy.
+_last_sent_config = None  # (control_channel, turbo, traction, stability, abs, hill_hold, coast, surface_adapt)
+
 def send_config():
-    """Send current config (turbo mode, traction control, stability control, etc.) to browser"""
+    """Send current config (turbo mode, traction control, stability control, etc.) to browser.
+    Skipped if the browser already has the current config.
+    """
     global control_channel, turbo_mode, traction_enabled, stability_enabled
     global abs_enabled, hill_hold_enabled, coast_enabled, surface_adapt_enabled
+    global _last_sent_config
     
     if control_channel is None or control_channel.readyState != "open":
         return False
     
+    config = (control_channel, turbo_mode, traction_enabled, stability_enabled,
+              abs_enabled, hill_hold_enabled, coast_enabled, surface_adapt_enabled)
+    if config == _last_sent_config:
+        return True  # Already up to date
+    
     # Format: seq(2) + cmd(1) + reserved(1) + turbo(1) + traction(1) + stability(1) + 
     #         abs(1) + hill_hold(1) + coast(1) + surface_adapt(1) = 11 bytes
-    message = struct.pack('<HBbBBBBBBB', 0, CMD_CONFIG, 0, 
-                          1 if turbo_mode else 0, 
-                          1 if traction_enabled else 0,
-                          1 if stability_enabled else 0,
-                          1 if abs_enabled else 0,
-                          1 if hill_hold_enabled else 0,
-                          1 if coast_enabled else 0,
-                          1 if surface_adapt_enabled else 0)
+    message = CONFIG_STRUCT.pack(0, CMD_CONFIG, 0, 
+                                 1 if turbo_mode else 0, 
+                                 1 if traction_enabled else 0,
+                                 1 if stability_enabled else 0,
+                                 1 if abs_enabled else 0,
+                                 1 if hill_hold_enabled else 0,
+                                 1 if coast_enabled else 0,
+                                 1 if surface_adapt_enabled else 0)
     control_channel.send(message)
+    _last_sent_config = config
     logger.info(f"Sent config: turbo={turbo_mode}, traction={traction_enabled}, stability={stability_enabled}, abs={abs_enabled}, hill_hold={hill_hold_enabled}, coast={coast_enabled}, surface_adapt={surface_adapt_enabled}")
     return True
 
@@ -2034,9 +2319,9 @@ def send_turbo_to_esp32():
         return False
     
     # Format: seq(2) + cmd(1) + turbo(1)
-    message = struct.pack('<HBB', 0, CMD_TURBO, 1 if turbo_mode else 0)
+    message = TURBO_STRUCT.pack(0, CMD_TURBO, 1 if turbo_mode else 0)
     try:
-        udp_sock.sendto(message, (ESP32_IP, ESP32_PORT))
+        udp_transport.sendto(message)
         logger.info(f"Sent turbo mode to ESP32: {turbo_mode}")
         return True
     except Exception as e:
@@ -2052,26 +2337,20 @@ def send_race_state():
     
     # If race is in progress, tell the browser
     if race_state == "racing":
-        # Send RACE_START_COUNTDOWN followed immediately by implicit "racing" 
-        # Actually, let's add a new sub-command for "already racing"
-        RACE_RESUME = 0x03  # New: resume into racing state immediately
-        message = struct.pack('<HBB', 0, CMD_RACE, RACE_RESUME)
-        control_channel.send(message)
-        logger.info("Sent race resume command")
-        return True
+        return send_race_command(RACE_RESUME)
     elif race_state == "countdown":
-        send_race_command(RACE_START_COUNTDOWN)
-        return True
+        return send_race_command(RACE_START_COUNTDOWN)
     
     return False
 
 async def countdown_to_racing():
     """Wait 3 seconds then enable controls"""
-    global race_state, race_start_time, race_start_pulse_count, hall_sensor
+    global race_state, race_start_time, race_start_monotonic, race_start_pulse_count, hall_sensor
     global imu_integrated_speed, fused_speed, wheel_speed
     await asyncio.sleep(3.0)
     race_state = "racing"
     race_start_time = time.time()
+    race_start_monotonic = time.monotonic()
     # Reset wheel distance tracking
     if hall_sensor:
         race_start_pulse_count = hall_sensor.get_pulse_count()
@@ -2086,16 +2365,30 @@ async def countdown_to_racing():
     start_telemetry_log()
     await start_recording()
 
+async def cancel_countdown():
+    """Cancel a pending countdown and wait for it to unwind, so it can't flip
+    race_state to "racing" after the caller has stopped the race"""
+    global countdown_task
+    
+    task = countdown_task
+    countdown_task = None
+    if task and not task.done():
+        task.cancel()
+        try:
+            await asyncio.wait_for(task, timeout=0.05)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            pass
+
 async def handle_start_race(request):
     """Admin endpoint to start race countdown"""
     global race_state, countdown_task
     
     # Check admin authentication
     if not check_admin_auth(request):
-        return web.json_response({"success": False, "error": "Unauthorized"}, status=401, headers=CORS_HEADERS)
+        return admin_response(RESP_UNAUTHORIZED, status=401)
     
     if race_state != "idle":
-        return web.json_response({"success": False, "error": "Race already in progress"}, status=400, headers=CORS_HEADERS)
+        return admin_response(RESP_RACE_IN_PROGRESS, status=400)
     
     if send_race_command(RACE_START_COUNTDOWN):
         race_state = "countdown"
@@ -2103,22 +2396,20 @@ async def handle_start_race(request):
         
         # Schedule transition to racing state after 3 seconds
         countdown_task = asyncio.create_task(countdown_to_racing())
-        return web.json_response({"success": True}, headers=CORS_HEADERS)
+        return admin_response(RESP_OK)
     else:
-        return web.json_response({"success": False, "error": "No player connected"}, status=400, headers=CORS_HEADERS)
+        return admin_response(RESP_NO_PLAYER, status=400)
 
 async def handle_stop_race(request):
     """Admin endpoint to stop race"""
-    global race_state, race_start_time, countdown_task
+    global race_state, race_start_time, race_start_monotonic
     
     # Check admin authentication
     if not check_admin_auth(request):
-        return web.json_response({"success": False, "error": "Unauthorized"}, status=401, headers=CORS_HEADERS)
+        return admin_response(RESP_UNAUTHORIZED, status=401)
     
     # Cancel countdown if in progress
-    if countdown_task and not countdown_task.done():
-        countdown_task.cancel()
-        countdown_task = None
+    await cancel_countdown()
     
     # Stop recording and telemetry logging if active
     stop_telemetry_log()
@@ -2126,10 +2417,11 @@ async def handle_stop_race(request):
     
     race_state = "idle"
     race_start_time = None
+    race_start_monotonic = None
     logger.info("Race stopped - controls disabled")
     
     send_race_command(RACE_STOP)
-    return web.json_response({"success": True}, headers=CORS_HEADERS)
+    return admin_response(RESP_OK)
 
 def send_kick_command():
     """Send kick notification to browser before disconnecting"""
@@ -2138,22 +2430,21 @@ def send_kick_command():
     if control_channel is None or control_channel.readyState != "open":
         return False
     
-    # Format: seq(2) + cmd(1) = 3 bytes
-    message = struct.pack('<HB', 0, CMD_KICK)
-    control_channel.send(message)
+    # Format: seq(2) + cmd(1) = 3 bytes (prebuilt, no variable fields)
+    control_channel.send(KICK_MESSAGE)
     logger.info("Sent kick command to browser")
     return True
 
 async def handle_kick_player(request):
     """Admin endpoint to kick player and revoke their token"""
-    global pc, control_channel, current_player_token, race_state, countdown_task
+    global pc, control_channel, current_player_token, race_state
     
     # Check admin authentication
     if not check_admin_auth(request):
-        return web.json_response({"success": False, "error": "Unauthorized"}, status=401, headers=CORS_HEADERS)
+        return admin_response(RESP_UNAUTHORIZED, status=401)
     
     if not pc or not control_channel:
-        return web.json_response({"success": False, "error": "No player connected"}, status=400, headers=CORS_HEADERS)
+        return admin_response(RESP_NO_PLAYER, status=400)
     
     # Revoke the token so they can't reconnect with it
     if current_player_token:
@@ -2161,9 +2452,7 @@ async def handle_kick_player(request):
         current_player_token = None
     
     # Stop any active race, recording, and telemetry logging
-    if countdown_task and not countdown_task.done():
-        countdown_task.cancel()
-        countdown_task = None
+    await cancel_countdown()
     stop_telemetry_log()
     await stop_recording()
     race_state = "idle"
@@ -2181,7 +2470,26 @@ async def handle_kick_player(request):
         control_channel = None
     
     logger.info("Player kicked and token revoked")
-    return web.json_response({"success": True}, headers=CORS_HEADERS)
+    return admin_response(RESP_OK)
+
+# Admin toggles are applied after a short quiet period, so a burst of clicks
+# results in a single ESP32 + DataChannel update with the latest values
+ADMIN_APPLY_DEBOUNCE = 0.05  # seconds
+_pending_admin_apply = None  # asyncio.TimerHandle for the scheduled apply
+
+def apply_admin_settings():
+    """Push current turbo mode to ESP32 and current config to browser"""
+    global _pending_admin_apply
+    _pending_admin_apply = None
+    send_turbo_to_esp32()
+    send_config()
+
+def schedule_admin_apply():
+    """(Re)schedule apply_admin_settings() after ADMIN_APPLY_DEBOUNCE of quiet"""
+    global _pending_admin_apply
+    if _pending_admin_apply:
+        _pending_admin_apply.cancel()
+    _pending_admin_apply = asyncio.get_running_loop().call_later(ADMIN_APPLY_DEBOUNCE, apply_admin_settings)
 
 async def handle_set_turbo(request):
     """Admin endpoint to toggle turbo mode"""
@@ -2189,7 +2497,7 @@ async def handle_set_turbo(request):
     
     # Check admin authentication
     if not check_admin_auth(request):
-        return web.json_response({"success": False, "error": "Unauthorized"}, status=401, headers=CORS_HEADERS)
+        return admin_response(RESP_UNAUTHORIZED, status=401)
     
     try:
         body = await request.json()
@@ -2197,16 +2505,13 @@ async def handle_set_turbo(request):
         turbo_mode = new_turbo
         logger.info(f"Turbo mode set to {turbo_mode}")
         
-        # Send turbo mode to ESP32
-        send_turbo_to_esp32()
-        
-        # Send updated config to browser
-        send_config()
+        # Send turbo mode to ESP32 and updated config to browser (debounced)
+        schedule_admin_apply()
         
-        return web.json_response({"success": True, "turbo_mode": turbo_mode}, headers=CORS_HEADERS)
+        return admin_response(json_bytes({"success": True, "turbo_mode": turbo_mode}))
     except Exception as e:
         logger.error(f"Error setting turbo: {e}")
-        return web.json_response({"success": False, "error": str(e)}, status=400, headers=CORS_HEADERS)
+        return admin_response(json_bytes({"success": False, "error": str(e)}), status=400)
 
 async def handle_set_traction_control(request):
     """Admin endpoint to toggle traction control"""
@@ -2214,7 +2519,7 @@ async def handle_set_traction_control(request):
     
     # Check admin authentication
     if not check_admin_auth(request):
-        return web.json_response({"success": False, "error": "Unauthorized"}, status=401, headers=CORS_HEADERS)
+        return admin_response(RESP_UNAUTHORIZED, status=401)
     
     try:
         body = await request.json()
@@ -2226,19 +2531,24 @@ async def handle_set_traction_control(request):
             traction_ctrl.enabled = traction_enabled
         
         logger.info(f"Traction control set to {traction_enabled}")
-        return web.json_response({
+        
+        # Send updated config to browser (debounced)
+        schedule_admin_apply()
+        
+        return admin_response(json_bytes({
             "success": True, 
             "traction_enabled": traction_enabled
-        }, headers=CORS_HEADERS)
+        }))
     except Exception as e:
         logger.error(f"Error setting traction control: {e}")
-        return web.json_response({"success": False, "error": str(e)}, status=400, headers=CORS_HEADERS)
+        return admin_response(json_bytes({"success": False, "error": str(e)}), status=400)
 
 # ----- Main -----
 
 async def main():
-    global telemetry_task, gps_task, imu_task, hall_sensor, traction_ctrl
+    global telemetry_task, gps_thread, imu_task, hall_sensor, traction_ctrl
     global abs_ctrl, throttle_tracker, hill_hold_ctrl, coast_ctrl, surface_adapt
+    global mediamtx_session
     
     # Load revoked tokens from file
     load_revoked_tokens()
@@ -2246,6 +2556,9 @@ async def main():
     # Load TURN credentials from mediamtx config
     load_turn_credentials()
     
+    # One pooled HTTP session for MediaMTX API calls (recording start/stop)
+    mediamtx_session = ClientSession(timeout=ClientTimeout(total=5))
+    
     # Setup headlight GPIO
     GPIO.setmode(GPIO.BCM)
     GPIO.setup(HEADLIGHT_GPIO_PIN, GPIO.OUT)
@@ -2253,7 +2566,7 @@ async def main():
     logger.info(f"Headlight GPIO {HEADLIGHT_GPIO_PIN} initialized")
     
     # Start ESP32 beacon discovery
-    asyncio.create_task(discover_esp32())
+    beacon_transport = await discover_esp32()
     
     # Start Hall sensor (wheel RPM)
     hall_sensor = HallRPM(gpio_pin=HALL_GPIO_PIN, magnets_per_rev=1, timeout=1.0)
@@ -2310,8 +2623,9 @@ async def main():
     direction_est = DirectionEstimator()
     logger.info("Direction estimator initialized")
     
-    # Start GPS reader loop
-    gps_task = asyncio.create_task(gps_reader_loop())
+    # Start GPS reader thread
+    gps_thread = threading.Thread(target=gps_reader_thread, args=(asyncio.get_running_loop(),), daemon=True)
+    gps_thread.start()
     
     # Start IMU (BNO055) reader loop
     imu_task = asyncio.create_task(imu_reader_loop())
@@ -2323,28 +2637,22 @@ async def main():
     telemetry_task = asyncio.create_task(telemetry_broadcast_loop())
     
     # Set up HTTP server for WebRTC signaling
-    app = web.Application()
+    app = web.Application(middlewares=[cors_middleware])
     app.router.add_post("/control/offer", handle_offer)
-    app.router.add_options("/control/offer", handle_options)
     app.router.add_get("/control/health", handle_health)
     
     # Telemetry subscriber endpoint (for restreamer, doesn't kick browser)
     app.router.add_post("/telemetry/offer", handle_telemetry_offer)
-    app.router.add_options("/telemetry/offer", handle_options)
     
     # Admin API routes (page served from Cloudflare)
     app.router.add_post("/admin/start-race", handle_start_race)
-    app.router.add_options("/admin/start-race", handle_options)
     app.router.add_post("/admin/stop-race", handle_stop_race)
-    app.router.add_options("/admin/stop-race", handle_options)
     app.router.add_post("/admin/kick-player", handle_kick_player)
-    app.router.add_options("/admin/kick-player", handle_options)
     app.router.add_post("/admin/set-turbo", handle_set_turbo)
-    app.router.add_options("/admin/set-turbo", handle_options)
     app.router.add_post("/admin/set-traction", handle_set_traction_control)
-    app.router.add_options("/admin/set-traction", handle_options)
     
-    runner = web.AppRunner(app)
+    # Keep idle HTTP connections open so dashboards polling /control/health reuse one connection
+    runner = web.AppRunner(app, keepalive_timeout=75)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", HTTP_PORT)
     await site.start()
@@ -2359,12 +2667,39 @@ async def main():
     logger.info(f"  POST /admin/kick-player         - Kick player & revoke token")
     logger.info(f"  POST /admin/set-traction        - Toggle traction control")
     
-    # Keep running
-    while True:
-        await asyncio.sleep(3600)
+    # Run until SIGINT/SIGTERM (no periodic wakeups while idle)
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    await stop_event.wait()
+    
+    # Clean shutdown
+    logger.info("Shutting down...")
+    if _pending_revoked_save:
+        _pending_revoked_save.cancel()
+        save_revoked_tokens(revoked_tokens)  # Don't lose a revocation made just before exit
+    for task in (telemetry_task, imu_task, wifi_task):
+        task.cancel()
+    if pc:
+        await pc.close()
+    await runner.cleanup()
+    await mediamtx_session.close()
+    beacon_transport.close()
+    if udp_transport:
+        udp_transport.close()
+    if hall_sensor:
+        hall_sensor.stop()
 
 if __name__ == "__main__":
+    run = asyncio.run
+    if uvloop is not None:
+        if hasattr(uvloop, "run"):
+            run = uvloop.run  # uvloop >= 0.18: no global policy (policies are deprecated in Python 3.14)
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logger.info("Shutting down...")
@@ -35,8 +35,22 @@ Usage:
 """
 
 import time
+from collections import deque, namedtuple
 from car_config import get_config
 
+KMH_TO_MS = 1.0 / 3.6  # Multiply instead of dividing on every update
+
+# Accelerometer bias is tracked toward the median of a sliding window of raw samples,
+# which ignores transient acceleration (launches, braking) that a plain EMA would absorb
+BIAS_WINDOW_SIZE = 80        # Samples (~4 s at the 20 Hz IMU loop)
+BIAS_UPDATE_INTERVAL = 10    # Recompute the median every N updates
+
+# Per-update diagnostics, published as one immutable tuple (a single attribute write per update)
+DirectionDiagnostics = namedtuple('DirectionDiagnostics', [
+    'signed_speed_kmh', 'direction', 'confidence',
+    'yaw_validation_active', 'yaw_agrees', 'accel_bias',
+])
+
 
 class DirectionEstimator:
     """
@@ -44,6 +58,18 @@ class DirectionEstimator:
     to estimate vehicle direction without a directional wheel sensor.
     """
     
+    __slots__ = (
+        '_throttle_seed_threshold', '_accel_confirm_threshold',
+        '_stopped_threshold', '_yaw_validation_min_speed',
+        '_min_steering_for_validation', '_min_yaw_rate_for_validation',
+        '_yaw_correction_min_speed', '_yaw_correction_min_yaw_rate',
+        '_stationary_decay_rate', '_stationary_accel_threshold', '_stationary_throttle_threshold',
+        '_bias_blend', '_accel_window', '_bias_update_counter',
+        '_confidence_decay_on_disagreement', '_confidence_decay_when_stationary', '_confidence_growth_rate',
+        '_signed_speed', '_last_update_time', '_direction_confidence', '_accel_bias_estimate',
+        'diagnostics',
+    )
+    
     def __init__(self):
         # Load config from car profile
         cfg = get_config()
@@ -93,9 +119,13 @@ class DirectionEstimator:
         )
         
         # === IMU bias estimation ===
-        self._bias_learning_rate = cfg.get_float(
+        bias_learning_rate = cfg.get_float(
             'direction_estimator', 'bias_learning_rate'
         )
+        # Per-sample learning rate applied once per BIAS_UPDATE_INTERVAL (same time constant)
+        self._bias_blend = min(1.0, bias_learning_rate * BIAS_UPDATE_INTERVAL)
+        self._accel_window = deque(maxlen=BIAS_WINDOW_SIZE)
+        self._bias_update_counter = 0
         
         # === Confidence tracking ===
         self._confidence_decay_on_disagreement = cfg.get_float(
@@ -110,18 +140,12 @@ class DirectionEstimator:
         
         # === State ===
         self._signed_speed = 0.0  # Integrated velocity (m/s, signed)
-        self._direction = "stopped"
-        self._last_update_time = time.time()
+        self._last_update_time = time.monotonic()  # Monotonic: immune to NTP/wall-clock steps
         self._direction_confidence = 0.0  # 0.0 to 1.0
         self._accel_bias_estimate = 0.0  # Estimated accelerometer bias (m/s²)
         
-        # Diagnostics
-        self.signed_speed_kmh = 0.0
-        self.direction = "stopped"
-        self.confidence = 0.0
-        self.yaw_validation_active = False
-        self.yaw_agrees = True
-        self.accel_bias = 0.0
+        # Diagnostics (also holds the current direction)
+        self.diagnostics = DirectionDiagnostics(0.0, "stopped", 0.0, False, True, 0.0)
     
     def update(self, imu_accel: float, wheel_speed_magnitude: float,
                throttle: int, steering: int, yaw_rate: float,
@@ -141,114 +165,129 @@ class DirectionEstimator:
             Signed speed estimate (km/h, positive = forward, negative = backward)
         """
         # Calculate dt if not provided
-        now = time.time()
+        now = time.monotonic()
         if dt is None:
             dt = now - self._last_update_time
         self._last_update_time = now
-        dt = max(0.001, min(0.1, dt))  # Clamp to reasonable range
+        # Clamp to reasonable range (comparisons, not min()/max() builtin calls)
+        if dt > 0.1:
+            dt = 0.1
+        elif dt < 0.001:
+            dt = 0.001
         
         # Convert wheel speed to m/s for internal calculations
-        wheel_speed_ms = wheel_speed_magnitude / 3.6
+        wheel_speed_ms = wheel_speed_magnitude * KMH_TO_MS
+        
+        # Hot state lives in locals for the whole update and is written back once at the end
+        signed_speed = self._signed_speed
+        confidence = self._direction_confidence
         
         # === Step 1: Update IMU bias estimate (high-pass filter) ===
-        # Slowly track the mean acceleration as bias
+        # Slowly track the windowed median acceleration as bias
         # This removes DC offset from accelerometer
-        self._accel_bias_estimate += self._bias_learning_rate * (imu_accel - self._accel_bias_estimate)
-        corrected_accel = imu_accel - self._accel_bias_estimate
-        self.accel_bias = self._accel_bias_estimate
+        accel_bias = self._accel_bias_estimate
+        self._accel_window.append(imu_accel)
+        self._bias_update_counter += 1
+        if self._bias_update_counter >= BIAS_UPDATE_INTERVAL:
+            self._bias_update_counter = 0
+            window = sorted(self._accel_window)
+            accel_bias += self._bias_blend * (window[len(window) // 2] - accel_bias)
         
         # === Step 2: Integrate bias-corrected IMU acceleration ===
-        self._signed_speed += corrected_accel * dt
+        signed_speed += (imu_accel - accel_bias) * dt
         
         # === Step 3: Bound by wheel speed magnitude ===
         # The integrated speed magnitude shouldn't exceed what the wheel reports
-        if abs(self._signed_speed) > wheel_speed_ms:
-            # Preserve sign, limit magnitude
-            self._signed_speed = (wheel_speed_ms * 
-                                  (1.0 if self._signed_speed > 0 else -1.0))
+        # (preserve sign, limit magnitude)
+        if signed_speed > wheel_speed_ms:
+            signed_speed = wheel_speed_ms
+        elif signed_speed < -wheel_speed_ms:
+            signed_speed = -wheel_speed_ms
         
         # === Step 4: Seed direction from standstill ===
         # When nearly stopped, use throttle + acceleration to determine initial direction
-        if abs(self._signed_speed) < 0.5 and wheel_speed_ms < 0.5:
-            if throttle > self._throttle_seed_threshold and imu_accel > self._accel_confirm_threshold:
+        if abs(signed_speed) < 0.5 and wheel_speed_ms < 0.5:
+            throttle_seed_threshold = self._throttle_seed_threshold
+            accel_confirm_threshold = self._accel_confirm_threshold
+            if throttle > throttle_seed_threshold and imu_accel > accel_confirm_threshold:
                 # Commanding forward and accelerating forward
-                self._signed_speed = 0.3  # Seed with small forward velocity
-                self._direction_confidence = 0.6
-            elif throttle < -self._throttle_seed_threshold and imu_accel < -self._accel_confirm_threshold:
+                signed_speed = 0.3  # Seed with small forward velocity
+                confidence = 0.6
+            elif throttle < -throttle_seed_threshold and imu_accel < -accel_confirm_threshold:
                 # Commanding backward and accelerating backward
-                self._signed_speed = -0.3  # Seed with small backward velocity
-                self._direction_confidence = 0.6
+                signed_speed = -0.3  # Seed with small backward velocity
+                confidence = 0.6
         
         # === Step 5: Yaw-steering correlation validation ===
         # When turning, check if yaw direction matches expected for current direction
-        self.yaw_validation_active = False
-        self.yaw_agrees = True
+        yaw_validation_active = False
+        yaw_agrees = True
         
+        abs_yaw_rate = abs(yaw_rate)
         if (abs(steering) > self._min_steering_for_validation and 
-            abs(yaw_rate) > self._min_yaw_rate_for_validation and
+            abs_yaw_rate > self._min_yaw_rate_for_validation and
             wheel_speed_ms > self._yaw_validation_min_speed):
             
-            self.yaw_validation_active = True
+            yaw_validation_active = True
             
             # Expected yaw direction when moving forward:
             # - Steering right (positive) → yaw negative (clockwise from above)
             # - Steering left (negative) → yaw positive (counter-clockwise from above)
             # So for forward motion: sign(steering) should be opposite to sign(yaw_rate)
             
-            expected_yaw_sign_forward = -1 if steering > 0 else 1
-            actual_yaw_sign = 1 if yaw_rate > 0 else -1
-            
-            yaw_says_forward = (actual_yaw_sign == expected_yaw_sign_forward)
-            imu_says_forward = self._signed_speed > 0
+            yaw_says_forward = (yaw_rate > 0) != (steering > 0)
+            imu_says_forward = signed_speed > 0
             
             if yaw_says_forward != imu_says_forward:
                 # Disagreement between IMU integration and yaw-steering correlation
-                self.yaw_agrees = False
+                yaw_agrees = False
                 
                 # Decay confidence on disagreement
-                self._direction_confidence *= self._confidence_decay_on_disagreement
+                confidence *= self._confidence_decay_on_disagreement
                 
                 # Trust yaw correlation when:
                 # 1. We have meaningful speed
                 # 2. The disagreement is clear (not borderline)
                 if (wheel_speed_ms > self._yaw_correction_min_speed and 
-                    abs(yaw_rate) > self._yaw_correction_min_yaw_rate):
+                    abs_yaw_rate > self._yaw_correction_min_yaw_rate):
                     # Flip direction
-                    self._signed_speed = -self._signed_speed
-                    self._direction_confidence = 0.8
+                    signed_speed = -signed_speed
+                    confidence = 0.8
         
         # === Step 6: Stationary drift correction ===
         # When wheel stopped and throttle released, decay integrated speed toward zero
         if (wheel_speed_ms < 0.3 and 
             abs(throttle) < self._stationary_throttle_threshold and
             abs(imu_accel) < self._stationary_accel_threshold):
-            self._signed_speed *= self._stationary_decay_rate
+            signed_speed *= self._stationary_decay_rate
             # Also decay confidence when stationary
-            self._direction_confidence *= self._confidence_decay_when_stationary
-            if abs(self._signed_speed) < 0.1:
-                self._signed_speed = 0.0
+            confidence *= self._confidence_decay_when_stationary
+            if abs(signed_speed) < 0.1:
+                signed_speed = 0.0
         
         # === Step 7: Update direction state ===
-        if abs(self._signed_speed) < self._stopped_threshold:
-            self._direction = "stopped"
-        elif self._signed_speed > 0:
-            self._direction = "forward"
+        if abs(signed_speed) < self._stopped_threshold:
+            direction = "stopped"
+        elif signed_speed > 0:
+            direction = "forward"
         else:
-            self._direction = "backward"
+            direction = "backward"
         
         # Update confidence based on speed (only grow when moving with agreement)
-        if wheel_speed_ms > 2.0 and self.yaw_agrees:
-            self._direction_confidence = min(
-                1.0, 
-                self._direction_confidence + self._confidence_growth_rate
-            )
+        if wheel_speed_ms > 2.0 and yaw_agrees:
+            confidence = min(1.0, confidence + self._confidence_growth_rate)
         
-        # Update diagnostics
-        self.signed_speed_kmh = self._signed_speed * 3.6
-        self.direction = self._direction
-        self.confidence = self._direction_confidence
+        # Write back state and diagnostics
+        self._signed_speed = signed_speed
+        self._direction_confidence = confidence
+        self._accel_bias_estimate = accel_bias
+        signed_speed_kmh = signed_speed * 3.6
+        self.diagnostics = DirectionDiagnostics(
+            signed_speed_kmh, direction, confidence,
+            yaw_validation_active, yaw_agrees, accel_bias
+        )
         
-        return self.signed_speed_kmh
+        return signed_speed_kmh
     
     def get_direction(self) -> str:
         """
@@ -257,7 +296,7 @@ class DirectionEstimator:
         Returns:
             "forward", "backward", or "stopped"
         """
-        return self._direction
+        return self.diagnostics.direction
     
     def get_signed_speed(self) -> float:
         """
@@ -266,7 +305,7 @@ class DirectionEstimator:
         Returns:
             Speed in km/h (positive = forward, negative = backward)
         """
-        return self.signed_speed_kmh
+        return self.diagnostics.signed_speed_kmh
     
     def get_status(self) -> dict:
         """
@@ -275,22 +314,22 @@ class DirectionEstimator:
         Returns:
             Dictionary with direction estimation state
         """
+        diag = self.diagnostics
         return {
-            'direction': self._direction,
-            'signed_speed': self.signed_speed_kmh,
+            'direction': diag.direction,
+            'signed_speed': diag.signed_speed_kmh,
             'confidence': self._direction_confidence,
-            'yaw_validation_active': self.yaw_validation_active,
-            'yaw_agrees': self.yaw_agrees,
-            'accel_bias': self.accel_bias
+            'yaw_validation_active': diag.yaw_validation_active,
+            'yaw_agrees': diag.yaw_agrees,
+            'accel_bias': diag.accel_bias
         }
     
     def reset(self):
         """Reset estimator state (e.g., when car is known to be stopped)."""
         self._signed_speed = 0.0
-        self._direction = "stopped"
         self._direction_confidence = 0.0
         # Note: Don't reset accel_bias - it should persist across resets
-        self.signed_speed_kmh = 0.0
-        self.direction = "stopped"
-        self.yaw_validation_active = False
-        self.yaw_agrees = True
+        self.diagnostics = self.diagnostics._replace(
+            signed_speed_kmh=0.0, direction="stopped",
+            yaw_validation_active=False, yaw_agrees=True
+        )
@@ -5,6 +5,12 @@ Hall Effect Sensor RPM Reader
 Calculates wheel RPM using a Hall effect sensor triggered by a magnet
 on the wheel. Uses GPIO interrupts for accurate pulse detection.
 
+If the pigpio daemon is running (sudo pigpiod), edges are timestamped by
+pigpio's DMA sampler with microsecond ticks and debounced by its glitch
+filter. Otherwise, if libgpiod v2 bindings are installed (required on Pi 5,
+where pigpio doesn't work), edges are kernel-timestamped and drained in
+batches by a reader thread. Falls back to RPi.GPIO edge detection.
+
 Usage:
     from hall_rpm import HallRPM
     
@@ -18,13 +24,33 @@ Usage:
     rpm_sensor.stop()
 """
 
+import glob
 import time
 import threading
+from collections import deque, namedtuple
+from datetime import timedelta
+try:
+    import pigpio  # Optional: lower-latency, hardware-timestamped edges
+except ImportError:
+    pigpio = None
+try:
+    import gpiod  # Optional: libgpiod v2 character-device edge events (Pi 5)
+    from gpiod.line import Bias, Direction, Edge
+except ImportError:
+    gpiod = None
 try:
     import RPi.GPIO as GPIO
 except ImportError:
     GPIO = None
 
+# gpiochip labels of the Pi's main GPIO header controller (Pi 5 / Pi 4 / earlier)
+GPIOCHIP_LABELS = ('pinctrl-rp1', 'pinctrl-bcm2711', 'pinctrl-bcm2835')
+GPIOD_MAX_EVENTS = 64          # Edge events drained per read (also the kernel event buffer size)
+GPIOD_COALESCE_INTERVAL = 0.01  # After a batch, let edges queue in the kernel this long before waking again
+
+# Snapshot returned by HallRPM.get_stats() (use ._asdict() where a dict is needed)
+HallStats = namedtuple('HallStats', 'rpm pulse_count pulse_interval_ms time_since_pulse running')
+
 
 class HallRPM:
     """
@@ -35,31 +61,49 @@ class HallRPM:
         magnets_per_rev: Number of magnets on the wheel (default: 1)
         timeout: Seconds without pulse before RPM is considered 0 (default: 0.5)
         debounce_ms: Software debounce time in milliseconds (default: 5)
+        median_window: Number of recent pulse intervals RPM is median-filtered over (default: 5)
     """
     
     def __init__(self, gpio_pin: int = 22, magnets_per_rev: int = 1, 
-                 timeout: float = 0.5, debounce_ms: int = 5):
+                 timeout: float = 0.5, debounce_ms: int = 5, median_window: int = 5):
         self.gpio_pin = gpio_pin
         self.magnets_per_rev = magnets_per_rev
         self.timeout = timeout
         self.debounce_ms = debounce_ms
         
-        # State
-        self._last_pulse_time = 0.0
-        self._pulse_interval = 0.0  # Time between last two pulses
-        self._pulse_count = 0
-        self._lock = threading.Lock()
+        # State (timestamps from time.monotonic(), immune to wall-clock adjustments).
+        # Lock-free: only the edge callback/reader thread writes, and it publishes
+        # (last_pulse_time, pulse_interval) as one tuple, so readers always see a
+        # consistent pair via a single (GIL-atomic) attribute load.
+        self._timing = (0.0, 0.0)  # (last pulse time, time between last two pulses)
+        self._pulse_count = 0      # Total edges seen (written by edge thread only)
+        self._count_base = 0       # _pulse_count at last reset_pulse_count()
+        # Recent intervals (edge thread appends; readers snapshot with tuple(), atomic under the GIL).
+        # Median filtering rejects the 2x/0.5x spikes from a missed or doubled pulse.
+        self._intervals = deque(maxlen=median_window)
         self._running = False
         
+        # pigpio backend (None when using RPi.GPIO)
+        self._pi = None
+        self._cb = None
+        self._last_tick = None  # pigpio tick (µs) of last pulse
+        
+        # gpiod backend (None unless in use)
+        self._request = None
+        self._reader = None
+        
     def start(self) -> bool:
         """Initialize GPIO and start listening for pulses. Returns True on success."""
+        if self._running:
+            return True
+        
+        if self._start_pigpio() or self._start_gpiod():
+            return True
+        
         if GPIO is None:
             print("RPi.GPIO not available")
             return False
             
-        if self._running:
-            return True
-            
         try:
             GPIO.setmode(GPIO.BCM)
             GPIO.setup(self.gpio_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
@@ -73,7 +117,7 @@ class HallRPM:
             )
             
             self._running = True
-            self._last_pulse_time = time.time()
+            self._timing = (time.monotonic(), self._timing[1])
             print(f"Hall RPM sensor started on GPIO {self.gpio_pin}")
             return True
             
@@ -81,66 +125,206 @@ class HallRPM:
             print(f"Failed to start Hall RPM sensor: {e}")
             return False
     
+    def _start_pigpio(self) -> bool:
+        """Start edge detection via the pigpio daemon. Returns False if unavailable."""
+        if pigpio is None:
+            return False
+        
+        pi = None
+        try:
+            pi = pigpio.pi()
+            if not pi.connected:
+                return False
+            pi.set_mode(self.gpio_pin, pigpio.INPUT)
+            pi.set_pull_up_down(self.gpio_pin, pigpio.PUD_UP)
+            # Level must be stable this long before an edge is reported (replaces bouncetime)
+            pi.set_glitch_filter(self.gpio_pin, self.debounce_ms * 1000)
+            
+            self._pi = pi
+            self._last_tick = None
+            self._cb = pi.callback(self.gpio_pin, pigpio.FALLING_EDGE, self._pigpio_callback)
+            
+            self._running = True
+            self._timing = (time.monotonic(), self._timing[1])
+            print(f"Hall RPM sensor started on GPIO {self.gpio_pin} (pigpio)")
+            return True
+            
+        except Exception as e:
+            print(f"pigpio unavailable, falling back to RPi.GPIO: {e}")
+            if pi is not None and pi.connected:
+                pi.stop()
+            self._pi = None
+            self._cb = None
+            return False
+    
+    def _start_gpiod(self) -> bool:
+        """Start edge detection via libgpiod v2. Returns False if unavailable."""
+        if gpiod is None:
+            return False
+        
+        try:
+            chip_path = None
+            for path in sorted(glob.glob('/dev/gpiochip*')):
+                with gpiod.Chip(path) as chip:
+                    if chip.get_info().label in GPIOCHIP_LABELS:
+                        chip_path = path
+                        break
+            if chip_path is None:
+                return False
+            
+            # Kernel debounce + edge timestamps on CLOCK_MONOTONIC (same clock as time.monotonic())
+            self._request = gpiod.request_lines(
+                chip_path,
+                consumer="hall_rpm",
+                config={self.gpio_pin: gpiod.LineSettings(
+                    direction=Direction.INPUT,
+                    edge_detection=Edge.FALLING,
+                    bias=Bias.PULL_UP,
+                    debounce_period=timedelta(milliseconds=self.debounce_ms),
+                )},
+                event_buffer_size=GPIOD_MAX_EVENTS,
+            )
+            
+            self._running = True
+            self._timing = (time.monotonic(), self._timing[1])
+            self._reader = threading.Thread(target=self._gpiod_reader, daemon=True)
+            self._reader.start()
+            print(f"Hall RPM sensor started on GPIO {self.gpio_pin} (gpiod {chip_path})")
+            return True
+            
+        except Exception as e:
+            print(f"gpiod unavailable, falling back to RPi.GPIO: {e}")
+            if self._request is not None:
+                self._request.release()
+                self._request = None
+            self._running = False
+            return False
+    
+    def _gpiod_reader(self):
+        """Drain kernel edge events in batches (one state publish per batch)."""
+        request = self._request
+        while self._running:
+            try:
+                if not request.wait_edge_events(timedelta(milliseconds=100)):
+                    continue
+                events = request.read_edge_events(GPIOD_MAX_EVENTS)
+            except Exception:
+                if self._running:
+                    time.sleep(0.1)
+                continue
+            
+            last_pulse_time, pulse_interval = self._timing
+            for event in events:
+                pulse_time = event.timestamp_ns / 1e9
+                if last_pulse_time > 0:
+                    pulse_interval = pulse_time - last_pulse_time
+                    self._add_interval(pulse_interval)
+                last_pulse_time = pulse_time
+            self._timing = (last_pulse_time, pulse_interval)
+            self._pulse_count += len(events)
+            
+            # Edges keep their kernel timestamps while queued, so waiting costs no accuracy;
+            # it caps Python wakeups (and GIL handoffs) at ~100/s regardless of pulse rate
+            time.sleep(GPIOD_COALESCE_INTERVAL)
+    
     def stop(self):
         """Stop listening and cleanup GPIO."""
         if self._running:
             try:
-                GPIO.remove_event_detect(self.gpio_pin)
-                GPIO.cleanup(self.gpio_pin)
+                if self._request is not None:
+                    self._running = False
+                    self._reader.join(timeout=1.0)
+                    self._request.release()
+                    self._request = None
+                    self._reader = None
+                elif self._pi is not None:
+                    self._cb.cancel()
+                    self._pi.set_glitch_filter(self.gpio_pin, 0)
+                    self._pi.stop()
+                    self._pi = None
+                    self._cb = None
+                else:
+                    GPIO.remove_event_detect(self.gpio_pin)
+                    GPIO.cleanup(self.gpio_pin)
             except Exception:
                 pass
             self._running = False
             print("Hall RPM sensor stopped")
     
+    def _pigpio_callback(self, gpio, level, tick):
+        """Called by pigpio on each magnet pass. tick is the edge time in µs (wraps at 2^32)."""
+        now = time.monotonic()
+        
+        pulse_interval = self._timing[1]
+        if self._last_tick is not None:
+            # Interval from the sampled edge timestamps, not callback delivery time
+            pulse_interval = pigpio.tickDiff(self._last_tick, tick) / 1e6
+            self._add_interval(pulse_interval)
+        self._last_tick = tick
+        self._timing = (now, pulse_interval)
+        self._pulse_count += 1
+    
     def _pulse_callback(self, channel):
         """Called on each magnet pass (falling edge)."""
-        now = time.time()
+        now = time.monotonic()
         
-        with self._lock:
-            if self._last_pulse_time > 0:
-                self._pulse_interval = now - self._last_pulse_time
-            self._last_pulse_time = now
-            self._pulse_count += 1
+        last_pulse_time, pulse_interval = self._timing
+        if last_pulse_time > 0:
+            pulse_interval = now - last_pulse_time
+            self._add_interval(pulse_interval)
+        self._timing = (now, pulse_interval)
+        self._pulse_count += 1
+    
+    def _add_interval(self, interval: float):
+        """Record a pulse interval (edge thread only)."""
+        if interval > self.timeout:
+            # Wheel was stopped: earlier intervals describe a previous run
+            self._intervals.clear()
+        self._intervals.append(interval)
     
     def get_rpm(self) -> float:
         """
-        Get current RPM based on pulse interval.
+        Get current RPM from the median of recent pulse intervals.
         Returns 0 if no recent pulses (wheel stopped).
         """
-        with self._lock:
-            # Check if wheel has stopped (no pulse within timeout)
-            if time.time() - self._last_pulse_time > self.timeout:
-                return 0.0
-            
-            # Need at least one interval measurement
-            if self._pulse_interval <= 0:
-                return 0.0
-            
-            # Calculate RPM: (60 seconds / interval) / magnets_per_rev
-            # interval is time for one magnet pass
-            rpm = (60.0 / self._pulse_interval) / self.magnets_per_rev
-            return rpm
+        last_pulse_time = self._timing[0]
+        
+        # Check if wheel has stopped (no pulse within timeout)
+        if time.monotonic() - last_pulse_time > self.timeout:
+            return 0.0
+        
+        # Need at least one interval measurement
+        intervals = sorted(tuple(self._intervals))
+        if not intervals:
+            return 0.0
+        pulse_interval = intervals[len(intervals) // 2]
+        if pulse_interval <= 0:
+            return 0.0
+        
+        # Calculate RPM: (60 seconds / interval) / magnets_per_rev
+        # interval is time for one magnet pass
+        rpm = (60.0 / pulse_interval) / self.magnets_per_rev
+        return rpm
     
     def get_pulse_count(self) -> int:
         """Get total pulse count since start."""
-        with self._lock:
-            return self._pulse_count
+        return self._pulse_count - self._count_base
     
     def reset_pulse_count(self):
         """Reset the pulse counter to zero."""
-        with self._lock:
-            self._pulse_count = 0
+        # Rebase instead of writing _pulse_count, so a concurrent edge can't be lost
+        self._count_base = self._pulse_count
     
-    def get_stats(self) -> dict:
+    def get_stats(self) -> HallStats:
         """Get all sensor statistics."""
-        with self._lock:
-            now = time.time()
-            time_since_pulse = now - self._last_pulse_time if self._last_pulse_time > 0 else float('inf')
-            
-            return {
-                'rpm': self.get_rpm(),
-                'pulse_count': self._pulse_count,
-                'pulse_interval_ms': self._pulse_interval * 1000 if self._pulse_interval > 0 else 0,
-                'time_since_pulse': time_since_pulse,
-                'running': self._running
-            }
\ No newline at end of file
+        last_pulse_time, pulse_interval = self._timing
+        now = time.monotonic()
+        time_since_pulse = now - last_pulse_time if last_pulse_time > 0 else float('inf')
+        
+        return HallStats(
+            self.get_rpm(),
+            self.get_pulse_count(),
+            pulse_interval * 1000 if pulse_interval > 0 else 0,
+            time_since_pulse,
+            self._running
+        )
\ No newline at end of file
@@ -29,13 +29,23 @@ Usage:
         pitch_deg=imu_pitch,           # degrees from BNO055
         speed_kmh=fused_speed,         # km/h
         throttle_input=throttle,       # driver input
-        timestamp=time.time()
+        timestamp=time.monotonic()
     )
 """
 
 import time
+from collections import namedtuple
 from car_config import get_config
 
+# _stationary_since while the car is not stationary (any real timestamp compares below it)
+NOT_STATIONARY = float('inf')
+
+# Snapshot returned by HillHold.get_status() (raw values; consumers round for display)
+HillHoldStatus = namedtuple('HillHoldStatus', [
+    'enabled', 'active', 'hold_force', 'blend_factor',
+    'pitch_at_activation', 'current_pitch',
+])
+
 
 class HillHold:
     """
@@ -48,6 +58,18 @@ class HillHold:
     4. TIMEOUT: No input for extended period = auto-release
     """
     
+    __slots__ = (
+        'PITCH_THRESHOLD_DEG', 'SPEED_THRESHOLD_KMH', 'THROTTLE_DEADZONE',
+        'HOLD_STRENGTH', 'MAX_HOLD_FORCE',
+        'IMMEDIATE_RELEASE_THRESHOLD', 'BLEND_RATE', 'TIMEOUT_SECONDS',
+        'SETTLING_TIME_S', 'PITCH_ALPHA',
+        '_release_speed_kmh', '_blend_step_uphill', '_blend_step_downhill', '_pitch_keep',
+        '_active', '_hold_force', '_blend_factor', '_timeout_at',
+        '_pitch_at_activation', '_uphill_positive', '_pitch_filt', '_pitch_primed',
+        '_prev_time', '_stationary_since',
+        'enabled',
+    )
+    
     def __init__(self):
         # Load config from car profile
         cfg = get_config()
@@ -72,21 +94,36 @@ class HillHold:
         # This prevents false activation from chassis tilt during acceleration
         self.SETTLING_TIME_S = cfg.get_float('hill_hold', 'settling_time_s', default=0.5)
         
+        # Pitch low-pass: single-pole IIR on IMU pitch so sensor noise near the
+        # threshold doesn't flicker activation (1.0 = unfiltered)
+        self.PITCH_ALPHA = cfg.get_float('hill_hold', 'pitch_alpha', default=0.2)
+        
+        # Derived thresholds (precomputed for the update() hot path)
+        self._release_speed_kmh = self.SPEED_THRESHOLD_KMH * 2  # Moving: driver overcame hold
+        self._blend_step_uphill = self.BLEND_RATE * 2      # Release quickly going uphill
+        self._blend_step_downhill = self.BLEND_RATE * 0.5  # Release slowly for controlled descent
+        self._pitch_keep = 1.0 - self.PITCH_ALPHA          # IIR weight of previous filtered pitch
+        
         # === State ===
         self._active = False
         self._hold_force = 0                # Current hold force being applied
         self._blend_factor = 1.0            # 1.0 = full hold, 0.0 = driver control
-        self._activation_time = 0.0
+        self._timeout_at = 0.0              # Auto-release time (activation + TIMEOUT_SECONDS)
         self._pitch_at_activation = 0.0
-        self._prev_time = time.time()
-        self._stationary_since = None       # When car became stationary with neutral throttle
-        
-        # Diagnostics
-        self.current_pitch = 0.0
+        self._uphill_positive = False       # Uphill is forward throttle (pitch > 0 at activation)
+        self._pitch_filt = 0.0              # Low-pass filtered pitch (degrees)
+        self._pitch_primed = False          # Filter seeded from a real sample yet
+        self._prev_time = time.monotonic()
+        self._stationary_since = NOT_STATIONARY  # When car became stationary with neutral throttle
         
         # Enable/disable
         self.enabled = True
     
+    @property
+    def current_pitch(self) -> float:
+        """Pitch as seen by hill hold (low-pass filtered, degrees); for diagnostics."""
+        return self._pitch_filt
+    
     def _calculate_hold_force(self, pitch_deg: float) -> int:
         """
         Calculate required throttle to hold position on incline.
@@ -101,69 +138,12 @@ class HillHold:
             Throttle force to apply (-MAX to +MAX)
         """
         force = int(pitch_deg * self.HOLD_STRENGTH)
-        return max(-self.MAX_HOLD_FORCE, min(self.MAX_HOLD_FORCE, force))
-    
-    def _should_activate(self, pitch_deg: float, speed_kmh: float, 
-                         throttle_input: int, timestamp: float) -> bool:
-        """
-        Determine if hill hold should engage.
-        
-        Conditions:
-        - On a significant incline
-        - Nearly stopped
-        - Throttle released (driver not actively controlling)
-        - Stationary for settling time (prevents false trigger from chassis tilt)
-        """
-        stationary = abs(speed_kmh) < self.SPEED_THRESHOLD_KMH
-        throttle_neutral = abs(throttle_input) < self.THROTTLE_DEADZONE
-        on_incline = abs(pitch_deg) > self.PITCH_THRESHOLD_DEG
-        
-        # Track when car became stationary with neutral throttle
-        if stationary and throttle_neutral:
-            if self._stationary_since is None:
-                self._stationary_since = timestamp
-        else:
-            self._stationary_since = None
-            return False
-        
-        # Require settling time before activation
-        # This filters out chassis pitch from acceleration/deceleration
-        settled = (timestamp - self._stationary_since) >= self.SETTLING_TIME_S
-        
-        return on_incline and settled
-    
-    def _determine_release_mode(self, throttle_input: int, 
-                                pitch_deg: float) -> str:
-        """
-        Determine how to release hill hold based on driver input.
-        
-        Args:
-            throttle_input: Current driver throttle
-            pitch_deg: Pitch angle at activation
-        
-        Returns:
-            Release mode: "hold", "immediate", "blend_up", "blend_down"
-        """
-        if abs(throttle_input) < self.THROTTLE_DEADZONE:
-            return "hold"
-        
-        # Strong input - immediate release regardless of direction
-        if abs(throttle_input) > self.IMMEDIATE_RELEASE_THRESHOLD:
-            return "immediate"
-        
-        # Check if throttle is fighting the hill or going with it
-        throttle_direction = 1 if throttle_input > 0 else -1
-        hill_direction = 1 if pitch_deg > 0 else -1  # Positive pitch = uphill
-        
-        # Driver wants to go uphill (fighting gravity)
-        going_uphill = (throttle_direction == hill_direction)
-        
-        if going_uphill:
-            # Driver is accelerating uphill - blend out quickly
-            return "blend_up"
-        else:
-            # Driver is going downhill - blend out slowly (controlled descent)
-            return "blend_down"
+        max_force = self.MAX_HOLD_FORCE
+        if force > max_force:
+            return max_force
+        if force < -max_force:
+            return -max_force
+        return force
     
     def update(self, 
                pitch_deg: float,         # IMU pitch (positive = nose up)
@@ -177,33 +157,68 @@ class HillHold:
             pitch_deg: Pitch angle from IMU (positive = nose up)
             speed_kmh: Vehicle speed (km/h)
             throttle_input: Driver throttle command
-            timestamp: Current time (defaults to time.time())
+            timestamp: Monotonic time in seconds (defaults to time.monotonic())
         
         Returns:
             Modified throttle (may include hold force)
         """
         if timestamp is None:
-            timestamp = time.time()
-        
+            timestamp = time.monotonic()
+        return self._update(pitch_deg, speed_kmh, throttle_input, timestamp)
+    
+    def _update(self, pitch_deg: float, speed_kmh: float,
+                throttle_input: int, timestamp: float) -> int:
+        """update() for callers that always have a timestamp (the control loop)."""
         if not self.enabled:
             self._active = False
             return throttle_input
         
         # Update timing
-        dt = timestamp - self._prev_time
         self._prev_time = timestamp
         
-        # Store for diagnostics
-        self.current_pitch = pitch_deg
+        # Low-pass pitch for activation and hold force (seeded from the first sample
+        # after construction / reset() so it doesn't ramp up from 0 on a slope)
+        if self._pitch_primed:
+            pitch_filt = self.PITCH_ALPHA * pitch_deg + self._pitch_keep * self._pitch_filt
+        else:
+            pitch_filt = pitch_deg
+            self._pitch_primed = True
+        self._pitch_filt = pitch_filt
+        
+        # Branch order follows the tick distribution while driving: inactive on
+        # flat ground is by far the most common, so it is tested first and returns
+        # before any other state is touched; the (rare) active hold comes last.
+        # Activation and release checks use thresholds bound to locals, with abs()
+        # replaced by range checks.
         
         # Check for activation
         if not self._active:
-            if self._should_activate(pitch_deg, speed_kmh, throttle_input, timestamp):
-                self._active = True
-                self._blend_factor = 1.0
-                self._activation_time = timestamp
-                self._pitch_at_activation = pitch_deg
-                self._hold_force = self._calculate_hold_force(pitch_deg)
+            # Flat ground: nothing to hold
+            pitch_threshold = self.PITCH_THRESHOLD_DEG
+            if -pitch_threshold <= pitch_filt <= pitch_threshold:
+                self._stationary_since = NOT_STATIONARY
+                return throttle_input
+            
+            # Track when car became stationary on the incline with neutral throttle
+            speed_threshold = self.SPEED_THRESHOLD_KMH
+            deadzone = self.THROTTLE_DEADZONE
+            if (-speed_threshold < speed_kmh < speed_threshold and
+                    -deadzone < throttle_input < deadzone):
+                stationary_since = self._stationary_since
+                if timestamp < stationary_since:
+                    self._stationary_since = stationary_since = timestamp
+                
+                # Settled long enough to filter out chassis pitch from
+                # acceleration/deceleration
+                if timestamp - stationary_since >= self.SETTLING_TIME_S:
+                    self._active = True
+                    self._blend_factor = 1.0
+                    self._timeout_at = timestamp + self.TIMEOUT_SECONDS
+                    self._pitch_at_activation = pitch_filt
+                    self._uphill_positive = pitch_filt > 0
+                    self._hold_force = self._calculate_hold_force(pitch_filt)
+            else:
+                self._stationary_since = NOT_STATIONARY
                 
             # Not active - pass through
             return throttle_input
@@ -211,68 +226,85 @@ class HillHold:
         # === ACTIVE HILL HOLD ===
         
         # Check timeout
-        if timestamp - self._activation_time > self.TIMEOUT_SECONDS:
+        if timestamp > self._timeout_at:
             self._active = False
             return throttle_input
         
         # Check if we've started moving (driver overcame hold)
-        if abs(speed_kmh) > self.SPEED_THRESHOLD_KMH * 2:
+        release_speed = self._release_speed_kmh
+        if speed_kmh > release_speed or speed_kmh < -release_speed:
             self._active = False
             return throttle_input
         
         # Determine release mode based on driver input
-        release_mode = self._determine_release_mode(throttle_input, self._pitch_at_activation)
+        deadzone = self.THROTTLE_DEADZONE
+        if -deadzone < throttle_input < deadzone:
+            # === MAINTAIN HOLD ===
+            return self._hold_force
         
-        if release_mode == "immediate":
+        immediate_threshold = self.IMMEDIATE_RELEASE_THRESHOLD
+        if throttle_input > immediate_threshold or throttle_input < -immediate_threshold:
             # === IMMEDIATE RELEASE ===
             self._active = False
             return throttle_input
-            
-        elif release_mode == "hold":
-            # === MAINTAIN HOLD ===
-            return self._hold_force
-            
-        elif release_mode == "blend_up":
+        
+        # Driver wants to go uphill (throttle and hill in the same direction)?
+        if (throttle_input > 0) == self._uphill_positive:
             # === BLEND OUT QUICKLY (going uphill) ===
-            self._blend_factor = max(0, self._blend_factor - self.BLEND_RATE * 2)
-            
-        elif release_mode == "blend_down":
+            blend_factor = self._blend_factor - self._blend_step_uphill
+        else:
             # === BLEND OUT SLOWLY (controlled descent) ===
-            self._blend_factor = max(0, self._blend_factor - self.BLEND_RATE * 0.5)
+            blend_factor = self._blend_factor - self._blend_step_downhill
         
         # Check if blend complete
-        if self._blend_factor <= 0:
+        if blend_factor <= 0:
+            self._blend_factor = 0
             self._active = False
             return throttle_input
+        self._blend_factor = blend_factor
         
         # === BLENDED OUTPUT ===
         # Combine hold force with driver input based on blend factor
-        blended = int(
-            self._hold_force * self._blend_factor + 
-            throttle_input * (1 - self._blend_factor)
-        )
+        inv_blend = 1.0 - blend_factor
+        blended = int(self._hold_force * blend_factor + throttle_input * inv_blend)
         
         # Clamp to valid range
-        return max(-32767, min(32767, blended))
+        if blended > 32767:
+            return 32767
+        if blended < -32767:
+            return -32767
+        return blended
+    
+    def simulate_batch(self, pitches, speeds, throttles, timestamps) -> list:
+        """
+        Run a recorded trajectory through the hill hold (offline tuning / replay).
+        
+        Args:
+            pitches, speeds, throttles, timestamps: Equal-length sequences of
+                update() inputs, one entry per control tick
+        
+        Returns:
+            List of output throttles; instance state advances as in live use
+        """
+        update = self._update
+        return [update(pitch, speed, throttle, ts)
+                for pitch, speed, throttle, ts in zip(pitches, speeds, throttles, timestamps)]
     
-    def get_status(self) -> dict:
+    def get_status(self) -> HillHoldStatus:
         """Get diagnostic status for telemetry."""
-        return {
-            "enabled": self.enabled,
-            "active": self._active,
-            "hold_force": self._hold_force,
-            "blend_factor": round(self._blend_factor, 2),
-            "pitch_at_activation": round(self._pitch_at_activation, 1),
-            "current_pitch": round(self.current_pitch, 1),
-        }
+        return HillHoldStatus(self.enabled, self._active, self._hold_force, self._blend_factor,
+                              self._pitch_at_activation, self._pitch_filt)
     
     def reset(self):
         """Reset state (call when race ends or connection resets)."""
         self._active = False
         self._hold_force = 0
         self._blend_factor = 1.0
-        self._activation_time = 0.0
+        self._timeout_at = 0.0
         self._pitch_at_activation = 0.0
+        self._uphill_positive = False
+        self._pitch_filt = 0.0
+        self._pitch_primed = False
 
 
 # === Test / Demo ===
@@ -293,10 +325,10 @@ if __name__ == "__main__":
             pitch_deg=15.0,
             speed_kmh=0.5,
             throttle_input=0,
-            timestamp=time.time() + i * 0.1
+            timestamp=time.monotonic() + i * 0.1
         )
         status = hill_hold.get_status()
-        print(f"  Throttle: 0 -> {result}, Active: {status['active']}, Hold: {status['hold_force']}")
+        print(f"  Throttle: 0 -> {result}, Active: {status.active}, Hold: {status.hold_force}")
     
     print("\n  Driver applies +200 throttle (uphill):")
     for i in range(10):
@@ -304,10 +336,10 @@ if __name__ == "__main__":
             pitch_deg=15.0,
             speed_kmh=0.5,
             throttle_input=200,
-            timestamp=time.time() + 0.5 + i * 0.1
+            timestamp=time.monotonic() + 0.5 + i * 0.1
         )
         status = hill_hold.get_status()
-        print(f"    Blend: {status['blend_factor']:.2f}, Output: {result}")
+        print(f"    Blend: {status.blend_factor:.2f}, Output: {result}")
     
     hill_hold.reset()
     
@@ -320,10 +352,10 @@ if __name__ == "__main__":
             pitch_deg=-10.0,
             speed_kmh=0.3,
             throttle_input=0,
-            timestamp=time.time() + i * 0.1
+            timestamp=time.monotonic() + i * 0.1
         )
         status = hill_hold.get_status()
-        print(f"  Throttle: 0 -> {result}, Active: {status['active']}, Hold: {status['hold_force']}")
+        print(f"  Throttle: 0 -> {result}, Active: {status.active}, Hold: {status.hold_force}")
     
     print("\n  Driver applies -150 throttle (downhill/reverse):")
     for i in range(15):
@@ -331,8 +363,8 @@ if __name__ == "__main__":
             pitch_deg=-10.0,
             speed_kmh=0.3,
             throttle_input=-150,
-            timestamp=time.time() + 0.5 + i * 0.1
+            timestamp=time.monotonic() + 0.5 + i * 0.1
         )
         status = hill_hold.get_status()
         if i % 3 == 0:
-            print(f"    Blend: {status['blend_factor']:.2f}, Output: {result}")
+            print(f"    Blend: {status.blend_factor:.2f}, Output: {result}")
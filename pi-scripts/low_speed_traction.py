@@ -44,8 +44,69 @@ Usage:
 
 import time
 import math
+from collections import namedtuple
 from car_config import get_config
 
+KMH_TO_MS = 1.0 / 3.6  # Multiply instead of dividing on every update
+
+# Control phases (ordered by speed, so the phase is the count of boundaries passed)
+PHASE_LAUNCH = 0
+PHASE_TRANSITION = 1
+PHASE_CRUISE = 2
+PHASE_NAMES = ("launch", "transition", "cruise")  # For telemetry / status
+
+# Wheel speed (m/s) below which the wheel sensor isn't trusted to scale the ground
+# speed cap or to learn IMU bias; the cap is floored here so it still bounds the
+# integrator with the wheels stopped
+MIN_TRUSTED_WHEEL_SPEED_MS = 1.0
+
+# Snapshot returned by LowSpeedTractionManager.get_status() (raw values; consumers
+# round for display, use ._asdict() where a dict is needed)
+TractionStatus = namedtuple('TractionStatus', [
+    'enabled', 'phase', 'slip_detected', 'slip_ratio', 'throttle_multiplier',
+    'launch_target', 'estimated_speed_kmh', 'wheel_accel', 'vehicle_accel',
+    'current_threshold',
+])
+
+
+def _ground_speed_step(estimated: float, bias: float, imu_accel: float,
+                       gps_speed_ms: float, gps_valid: bool, prev_wheel_speed: float,
+                       dt: float, alpha: float, min_speed_ms: float,
+                       bias_gain: float) -> tuple:
+    """
+    One step of the IMU-primary ground speed estimate (speeds in m/s).
+    
+    Shared by LowSpeedTractionManager.update() and simulate_ground_speed() so the
+    online and offline estimates stay identical.
+    
+    Returns:
+        (estimated, bias) after this step
+    """
+    # Integrate bias-corrected IMU acceleration
+    estimated += (imu_accel - bias) * dt
+    
+    # Prevent negative speed (not fed back: at standstill this clamp only
+    # rectifies sensor noise, and learning from it would drag the bias negative)
+    if estimated < 0:
+        estimated = 0.0
+    
+    # Very slow GPS drift correction
+    if gps_valid and gps_speed_ms > min_speed_ms:
+        estimated += alpha * (gps_speed_ms - estimated)
+    
+    # Cap estimated speed to reasonable value based on (previous) wheel speed,
+    # floored so a stopped wheel still bounds the integrator
+    max_reasonable = prev_wheel_speed * 1.1
+    if max_reasonable < MIN_TRUSTED_WHEEL_SPEED_MS:
+        max_reasonable = MIN_TRUSTED_WHEEL_SPEED_MS
+    if estimated > max_reasonable:
+        # Back-calculation: overshooting a trusted wheel speed means the integrated
+        # accel was biased high (dt is already clamped to >= 1 ms)
+        if prev_wheel_speed > MIN_TRUSTED_WHEEL_SPEED_MS:
+            bias += bias_gain * (estimated - max_reasonable) / dt
+        estimated = max_reasonable
+    return estimated, bias
+
 
 class LowSpeedTractionManager:
     """
@@ -63,6 +124,22 @@ class LowSpeedTractionManager:
     # Scale factor: config uses 0-1000 range, actual throttle is -32767 to 32767
     THROTTLE_SCALE = 32767 / 1000
     
+    __slots__ = (
+        'LAUNCH_PHASE_END', 'TRANSITION_PHASE_END', '_inv_transition_span',
+        'LAUNCH_TARGET_SLIP', 'LAUNCH_SLIP_TOLERANCE', 'LAUNCH_MAX_THROTTLE_RATE',
+        'LAUNCH_THROTTLE_CEILING', 'LAUNCH_SLIP_HIGH_CUT',
+        'CRUISE_SLIP_THRESHOLD', 'CRUISE_THROTTLE_CUT_RATE', 'CRUISE_RECOVERY_RATE',
+        'CRUISE_MIN_MULTIPLIER',
+        'MIN_THROTTLE_FOR_SLIP', '_min_forward_throttle', 'YAW_RATE_THRESHOLD', 'ACCEL_SMOOTHING',
+        'GPS_DRIFT_CORRECTION_ALPHA', 'GPS_DRIFT_CORRECTION_MIN_SPEED', '_gps_drift_min_speed_ms',
+        'IMU_BIAS_TRACK_GAIN', '_imu_bias_est',
+        '_phase', '_throttle_multiplier', '_launch_throttle_target', '_slip_detected',
+        '_prev_time_ns', '_estimated_ground_speed', '_prev_wheel_speed',
+        '_wheel_accel_smooth', '_vehicle_accel_smooth',
+        'slip_ratio', 'wheel_accel', 'vehicle_accel', 'current_slip_threshold',
+        'enabled',
+    )
+    
     def __init__(self):
         # Load config from car profile
         cfg = get_config()
@@ -70,6 +147,8 @@ class LowSpeedTractionManager:
         # === Phase Boundaries ===
         self.LAUNCH_PHASE_END = cfg.get_float('low_speed_traction', 'launch_phase_end_kmh')
         self.TRANSITION_PHASE_END = cfg.get_float('low_speed_traction', 'transition_phase_end_kmh')
+        # Reciprocal of the transition band width (transition blend multiplies instead of dividing)
+        self._inv_transition_span = 1.0 / max(1e-6, self.TRANSITION_PHASE_END - self.LAUNCH_PHASE_END)
         
         # === Launch Phase Parameters (proactive) ===
         # Note: Config values are in 0-1000 range, scale to actual throttle range
@@ -87,23 +166,29 @@ class LowSpeedTractionManager:
         
         # === Shared Parameters ===
         self.MIN_THROTTLE_FOR_SLIP = int(cfg.get_int('low_speed_traction', 'min_throttle_for_slip') * self.THROTTLE_SCALE)
+        self._min_forward_throttle = max(1, self.MIN_THROTTLE_FOR_SLIP)  # Single early-out bound (throttle > 0 too)
         self.YAW_RATE_THRESHOLD = cfg.get_float('low_speed_traction', 'yaw_rate_threshold')
         self.ACCEL_SMOOTHING = cfg.get_float('low_speed_traction', 'accel_smoothing')
         
         # === Ground Speed Estimation (IMU-primary) ===
         self.GPS_DRIFT_CORRECTION_ALPHA = cfg.get_float('low_speed_traction', 'gps_drift_correction_alpha')
         self.GPS_DRIFT_CORRECTION_MIN_SPEED = cfg.get_float('low_speed_traction', 'gps_drift_correction_min_speed_kmh')
+        self._gps_drift_min_speed_ms = self.GPS_DRIFT_CORRECTION_MIN_SPEED * KMH_TO_MS
+        # Anti-windup: when the estimate is clamped at a trusted wheel-speed cap,
+        # the clamped-off residual is fed back into an IMU accel bias estimate
+        self.IMU_BIAS_TRACK_GAIN = cfg.get_float('low_speed_traction', 'imu_bias_track_gain', default=0.01)
         
         # === State ===
-        self._phase = "launch"
+        self._phase = PHASE_LAUNCH
         self._throttle_multiplier = 1.0
         self._launch_throttle_target = 0
         self._slip_detected = False
-        self._prev_time = time.time()
+        self._prev_time_ns = time.monotonic_ns()
         
         # Ground speed estimation
         self._estimated_ground_speed = 0.0   # m/s
         self._prev_wheel_speed = 0.0         # m/s
+        self._imu_bias_est = 0.0             # m/s², learned from wheel cap residuals (kept across reset())
         
         # Smoothed values
         self._wheel_accel_smooth = 0.0
@@ -118,77 +203,61 @@ class LowSpeedTractionManager:
         # Enable/disable
         self.enabled = True
     
-    def _calculate_slip_ratio(self, wheel_speed_ms: float, 
-                               ground_speed_ms: float) -> float:
+    def _determine_phase(self, ground_speed_kmh: float) -> int:
+        """Determine current control phase (PHASE_*) based on speed."""
+        return ((ground_speed_kmh >= self.LAUNCH_PHASE_END) +
+                (ground_speed_kmh >= self.TRANSITION_PHASE_END))
+    
+    @staticmethod
+    def simulate_ground_speed(imu_accels, gps_speeds_ms, wheel_speeds_ms, dts,
+                              gps_valid, alpha: float, min_speed_ms: float,
+                              bias_gain: float) -> list:
         """
-        Calculate wheel slip ratio.
+        Replay the IMU-primary ground speed estimator over a logged run.
         
-        Positive = wheel spinning faster than ground (acceleration slip)
+        Offline counterpart of the estimate in update(), with the GPS drift gains
+        passed in so they can be swept without touching the car profile.
         
         Args:
-            wheel_speed_ms: Wheel speed in m/s
-            ground_speed_ms: Ground speed in m/s
+            imu_accels: Forward acceleration per sample (m/s²)
+            gps_speeds_ms: GPS/fused speed per sample (m/s)
+            wheel_speeds_ms: Wheel speed per sample (m/s)
+            dts: Time step per sample (s, already clamped as in update())
+            gps_valid: GPS fix flag per sample
+            alpha: GPS drift correction gain (gps_drift_correction_alpha)
+            min_speed_ms: Minimum GPS speed for drift correction (m/s)
+            bias_gain: Anti-windup IMU bias tracking gain (imu_bias_track_gain)
         
         Returns:
-            Slip ratio (0.0 = no slip, 0.1 = 10% slip, etc.)
+            Estimated ground speed per sample (m/s)
         """
-        if ground_speed_ms < 0.5:
-            # At very low speed, use absolute difference normalized by wheel speed
-            if wheel_speed_ms < 0.1:
-                return 0.0
-            return (wheel_speed_ms - ground_speed_ms) / max(wheel_speed_ms, 1.0)
-        return (wheel_speed_ms - ground_speed_ms) / ground_speed_ms
+        estimated = 0.0
+        bias = 0.0
+        prev_wheel_speed = 0.0
+        out = []
+        append = out.append
+        for imu_accel, gps_speed_ms, wheel_speed_ms, dt, valid in zip(
+                imu_accels, gps_speeds_ms, wheel_speeds_ms, dts, gps_valid):
+            estimated, bias = _ground_speed_step(
+                estimated, bias, imu_accel, gps_speed_ms, valid, prev_wheel_speed,
+                dt, alpha, min_speed_ms, bias_gain)
+            prev_wheel_speed = wheel_speed_ms
+            append(estimated)
+        return out
     
-    def _determine_phase(self, ground_speed_kmh: float) -> str:
-        """Determine current control phase based on speed."""
-        if ground_speed_kmh < self.LAUNCH_PHASE_END:
-            return "launch"
-        elif ground_speed_kmh < self.TRANSITION_PHASE_END:
-            return "transition"
-        else:
-            return "cruise"
-    
-    def _update_ground_speed_estimate(self, imu_accel: float, gps_speed_ms: float,
-                                       gps_valid: bool, dt: float):
+    def _launch_compute(self, throttle_input: int, slip_ratio: float,
+                        grip_multiplier: float) -> tuple:
         """
-        IMU-primary ground speed estimation.
-        
-        Uses IMU forward acceleration integration as primary source.
-        GPS is used only for very slow drift correction.
-        """
-        # Integrate IMU acceleration
-        self._estimated_ground_speed += imu_accel * dt
-        
-        # Prevent negative speed
-        self._estimated_ground_speed = max(0, self._estimated_ground_speed)
+        Launch phase math for positive throttle, without touching state.
         
-        # Very slow GPS drift correction
-        if gps_valid and gps_speed_ms > self.GPS_DRIFT_CORRECTION_MIN_SPEED / 3.6:
-            drift_error = gps_speed_ms - self._estimated_ground_speed
-            self._estimated_ground_speed += self.GPS_DRIFT_CORRECTION_ALPHA * drift_error
-        
-        # Cap estimated speed to reasonable value based on wheel speed
-        if self._prev_wheel_speed > 1.0:
-            max_reasonable = self._prev_wheel_speed * 1.1
-            self._estimated_ground_speed = min(self._estimated_ground_speed, max_reasonable)
-    
-    def _launch_control(self, throttle_input: int, slip_ratio: float,
-                        grip_multiplier: float) -> int:
-        """
-        Launch phase: Proactive slip targeting.
-        
-        Gradually increase throttle while maintaining target slip.
+        Returns:
+            (output throttle, new launch throttle target, slip detected)
         """
-        # Only active on positive throttle
-        if throttle_input <= 0:
-            self._launch_throttle_target = 0
-            return throttle_input
-        
         # Adjust target slip based on grip
         adjusted_target = self.LAUNCH_TARGET_SLIP * grip_multiplier
         
         # Ramp up throttle target
-        self._launch_throttle_target = min(
+        target = min(
             self._launch_throttle_target + self.LAUNCH_MAX_THROTTLE_RATE,
             min(throttle_input, self.LAUNCH_THROTTLE_CEILING)
         )
@@ -196,48 +265,64 @@ class LowSpeedTractionManager:
         # Adjust based on current slip
         if slip_ratio > adjusted_target * 1.3:
             # Too much slip - back off significantly
-            self._slip_detected = True
-            return int(self._launch_throttle_target * self.LAUNCH_SLIP_HIGH_CUT)
+            return int(target * self.LAUNCH_SLIP_HIGH_CUT), target, True
         elif slip_ratio > adjusted_target * 1.1:
             # Slightly over target - hold steady
-            self._slip_detected = True
-            return self._launch_throttle_target
+            return target, target, True
         else:
             # At or below target - continue ramp
-            self._slip_detected = False
-            return self._launch_throttle_target
+            return target, target, False
     
-    def _cruise_control(self, throttle_input: int, slip_ratio: float,
-                        yaw_rate_abs: float, grip_multiplier: float) -> int:
+    def _launch_control(self, throttle_input: int, slip_ratio: float,
+                        grip_multiplier: float) -> int:
         """
-        Cruise phase: Reactive slip detection and correction.
+        Launch phase: Proactive slip targeting.
+        
+        Gradually increase throttle while maintaining target slip.
+        Requires throttle_input > 0 (apply_to_throttle() filters the rest).
         """
-        if throttle_input <= 0:
-            self._throttle_multiplier = 1.0
-            self._slip_detected = False
-            return throttle_input
+        output, self._launch_throttle_target, self._slip_detected = \
+            self._launch_compute(throttle_input, slip_ratio, grip_multiplier)
+        return output
+    
+    def _cruise_compute(self, throttle_input: int, slip_ratio: float,
+                        yaw_rate_abs: float, grip_multiplier: float) -> tuple:
+        """
+        Cruise phase math for positive throttle, without touching state.
         
+        Returns:
+            (output throttle, new throttle multiplier, slip detected, slip threshold)
+        """
         # Adjust threshold based on grip and turn state
         turn_factor = 1.5 if yaw_rate_abs > self.YAW_RATE_THRESHOLD else 1.0
         adjusted_threshold = self.CRUISE_SLIP_THRESHOLD * grip_multiplier * turn_factor
-        self.current_slip_threshold = adjusted_threshold
         
         if slip_ratio > adjusted_threshold:
             # Slip detected - cut throttle
-            self._slip_detected = True
-            self._throttle_multiplier = max(
+            multiplier = max(
                 self.CRUISE_MIN_MULTIPLIER,
                 self._throttle_multiplier - self.CRUISE_THROTTLE_CUT_RATE
             )
+            slip_detected = True
         else:
             # No slip - recover
-            self._slip_detected = False
-            self._throttle_multiplier = min(
+            multiplier = min(
                 1.0,
                 self._throttle_multiplier + self.CRUISE_RECOVERY_RATE
             )
+            slip_detected = False
         
-        return int(throttle_input * self._throttle_multiplier)
+        return int(throttle_input * multiplier), multiplier, slip_detected, adjusted_threshold
+    
+    def _cruise_control(self, throttle_input: int, slip_ratio: float,
+                        yaw_rate_abs: float, grip_multiplier: float) -> int:
+        """
+        Cruise phase: Reactive slip detection and correction.
+        Requires throttle_input > 0 (apply_to_throttle() filters the rest).
+        """
+        output, self._throttle_multiplier, self._slip_detected, self.current_slip_threshold = \
+            self._cruise_compute(throttle_input, slip_ratio, yaw_rate_abs, grip_multiplier)
+        return output
     
     def _transition_control(self, throttle_input: int, slip_ratio: float,
                             ground_speed_kmh: float, yaw_rate_abs: float,
@@ -245,19 +330,33 @@ class LowSpeedTractionManager:
         """
         Transition phase: Blend between launch and cruise strategies.
         
-        Smoothly interpolates behavior to prevent sudden changes.
+        Smoothly interpolates behavior to prevent sudden changes. Both
+        strategies are evaluated side-effect free; their state (launch target,
+        cruise multiplier) then advances in proportion to the blend, so neither
+        stomps on the other. Called with positive throttle only.
         """
         # Calculate blend factor (0 = full launch, 1 = full cruise)
-        blend = (ground_speed_kmh - self.LAUNCH_PHASE_END) / \
-                (self.TRANSITION_PHASE_END - self.LAUNCH_PHASE_END)
+        blend = (ground_speed_kmh - self.LAUNCH_PHASE_END) * self._inv_transition_span
         blend = max(0, min(1, blend))
+        launch_weight = 1 - blend
         
         # Get outputs from both strategies
-        launch_output = self._launch_control(throttle_input, slip_ratio, grip_multiplier)
-        cruise_output = self._cruise_control(throttle_input, slip_ratio, yaw_rate_abs, grip_multiplier)
+        launch_output, launch_target, launch_slip = \
+            self._launch_compute(throttle_input, slip_ratio, grip_multiplier)
+        cruise_output, multiplier, cruise_slip, self.current_slip_threshold = \
+            self._cruise_compute(throttle_input, slip_ratio, yaw_rate_abs, grip_multiplier)
+        
+        # Advance each strategy's state by its share of authority
+        self._launch_throttle_target = int(
+            self._launch_throttle_target * blend + launch_target * launch_weight
+        )
+        self._throttle_multiplier = (
+            self._throttle_multiplier * launch_weight + multiplier * blend
+        )
+        self._slip_detected = cruise_slip if blend >= 0.5 else launch_slip
         
         # Blend them
-        return int(launch_output * (1 - blend) + cruise_output * blend)
+        return int(launch_output * launch_weight + cruise_output * blend)
     
     def update(self,
                wheel_speed: float,        # km/h from hall sensor
@@ -284,39 +383,54 @@ class LowSpeedTractionManager:
             self._slip_detected = False
             return
         
-        now = time.time()
-        dt = now - self._prev_time
-        self._prev_time = now
+        # Monotonic integer clock: dt stays exact and can't go negative on NTP steps
+        now_ns = time.monotonic_ns()
+        dt_ns = now_ns - self._prev_time_ns
+        self._prev_time_ns = now_ns
         
-        # Clamp dt
-        dt = max(0.001, min(0.1, dt))
+        # Clamp dt to 1-100 ms
+        if dt_ns < 1_000_000:
+            dt_ns = 1_000_000
+        elif dt_ns > 100_000_000:
+            dt_ns = 100_000_000
+        dt = dt_ns * 1e-9
         
         # Convert to m/s
-        wheel_speed_ms = wheel_speed / 3.6
-        ground_speed_ms = ground_speed / 3.6
-        gps_speed_ms = ground_speed / 3.6  # Use fused speed as GPS proxy
-        
-        # Update ground speed estimate
-        self._update_ground_speed_estimate(imu_forward_accel, gps_speed_ms, gps_valid, dt)
+        wheel_speed_ms = wheel_speed * KMH_TO_MS
+        gps_speed_ms = ground_speed * KMH_TO_MS  # Use fused speed as GPS proxy
+        prev_wheel_speed = self._prev_wheel_speed
+        
+        # Update ground speed estimate (IMU-primary, GPS drift corrected, wheel capped)
+        estimated, self._imu_bias_est = _ground_speed_step(
+            self._estimated_ground_speed, self._imu_bias_est, imu_forward_accel,
+            gps_speed_ms, gps_valid, prev_wheel_speed, dt,
+            self.GPS_DRIFT_CORRECTION_ALPHA, self._gps_drift_min_speed_ms,
+            self.IMU_BIAS_TRACK_GAIN)
+        self._estimated_ground_speed = estimated
         
         # Calculate wheel acceleration
-        wheel_accel_raw = (wheel_speed_ms - self._prev_wheel_speed) / dt
+        wheel_accel_raw = (wheel_speed_ms - prev_wheel_speed) / dt
         self._prev_wheel_speed = wheel_speed_ms
         
-        # Smooth accelerations
-        self._wheel_accel_smooth += self.ACCEL_SMOOTHING * (wheel_accel_raw - self._wheel_accel_smooth)
-        self._vehicle_accel_smooth += self.ACCEL_SMOOTHING * (imu_forward_accel - self._vehicle_accel_smooth)
-        
-        # Store for diagnostics
-        self.wheel_accel = self._wheel_accel_smooth
-        self.vehicle_accel = self._vehicle_accel_smooth
-        
-        # Use estimated ground speed for slip calculation (not wheel speed)
-        # This is more accurate since we integrate IMU data
-        ground_speed_for_slip = self._estimated_ground_speed
-        
-        # Calculate slip ratio
-        self.slip_ratio = self._calculate_slip_ratio(wheel_speed_ms, ground_speed_for_slip)
+        # Smooth accelerations (also stored for diagnostics)
+        alpha = self.ACCEL_SMOOTHING
+        wheel_accel = self._wheel_accel_smooth
+        wheel_accel += alpha * (wheel_accel_raw - wheel_accel)
+        vehicle_accel = self._vehicle_accel_smooth
+        vehicle_accel += alpha * (imu_forward_accel - vehicle_accel)
+        self._wheel_accel_smooth = self.wheel_accel = wheel_accel
+        self._vehicle_accel_smooth = self.vehicle_accel = vehicle_accel
+        
+        # Calculate slip ratio against the estimated ground speed (not wheel speed);
+        # this is more accurate since we integrate IMU data
+        if estimated < 0.5:
+            # At very low speed, use absolute difference normalized by wheel speed
+            if wheel_speed_ms < 0.1:
+                self.slip_ratio = 0.0
+            else:
+                self.slip_ratio = (wheel_speed_ms - estimated) / (wheel_speed_ms if wheel_speed_ms > 1.0 else 1.0)
+        else:
+            self.slip_ratio = (wheel_speed_ms - estimated) / estimated
         
         # Determine phase
         self._phase = self._determine_phase(ground_speed)
@@ -326,7 +440,8 @@ class LowSpeedTractionManager:
         """
         Apply traction control to throttle command.
         
-        Only affects positive throttle (forward acceleration).
+        Only affects positive throttle (forward acceleration): the phase
+        controllers below are only ever called with throttle > 0.
         
         Args:
             throttle: Raw throttle (-32767 to 32767 or -1000 to 1000)
@@ -336,19 +451,17 @@ class LowSpeedTractionManager:
         Returns:
             Limited throttle
         """
-        if not self.enabled or throttle <= 0:
-            return throttle
-        
-        # Check minimum throttle
-        if throttle < self.MIN_THROTTLE_FOR_SLIP:
+        # Reverse/neutral or below the minimum throttle: pass through
+        if not self.enabled or throttle < self._min_forward_throttle:
             return throttle
         
         yaw_rate_abs = abs(yaw_rate)
         
         # Apply phase-appropriate control
-        if self._phase == "launch":
+        phase = self._phase
+        if phase == PHASE_LAUNCH:
             return self._launch_control(throttle, self.slip_ratio, grip_multiplier)
-        elif self._phase == "transition":
+        elif phase == PHASE_TRANSITION:
             return self._transition_control(
                 throttle, self.slip_ratio, 
                 self._estimated_ground_speed * 3.6,  # Convert back to km/h
@@ -366,24 +479,18 @@ class LowSpeedTractionManager:
             return 1.0
         return self._throttle_multiplier
     
-    def get_status(self) -> dict:
+    def get_status(self) -> TractionStatus:
         """Get diagnostic status for telemetry."""
-        return {
-            "enabled": self.enabled,
-            "phase": self._phase,
-            "slip_detected": self._slip_detected,
-            "slip_ratio": round(self.slip_ratio, 3),
-            "throttle_multiplier": round(self._throttle_multiplier, 2),
-            "launch_target": self._launch_throttle_target,
-            "estimated_speed_kmh": round(self._estimated_ground_speed * 3.6, 1),
-            "wheel_accel": round(self.wheel_accel, 2),
-            "vehicle_accel": round(self.vehicle_accel, 2),
-            "current_threshold": round(self.current_slip_threshold, 3),
-        }
+        return TractionStatus(
+            self.enabled, PHASE_NAMES[self._phase], self._slip_detected,
+            self.slip_ratio, self._throttle_multiplier, self._launch_throttle_target,
+            self._estimated_ground_speed * 3.6, self.wheel_accel, self.vehicle_accel,
+            self.current_slip_threshold,
+        )
     
     def reset(self):
         """Reset state (call when race ends or connection resets)."""
-        self._phase = "launch"
+        self._phase = PHASE_LAUNCH
         self._throttle_multiplier = 1.0
         self._launch_throttle_target = 0
         self._slip_detected = False
@@ -399,6 +506,7 @@ class LowSpeedTractionManager:
 if __name__ == "__main__":
     import random
     
+    rng = random.Random(0)  # Seeded: reproducible demo output
     traction = LowSpeedTractionManager()
     
     print("Low Speed Traction Manager Simulation")
@@ -426,12 +534,17 @@ if __name__ == "__main__":
     for name, params in scenarios:
         print(f"\n{name}:")
         
+        # Sensor noise for this scenario
+        wheel_noise = [rng.uniform(-0.5, 0.5) for _ in range(10)]
+        ground_noise = [rng.uniform(-0.3, 0.3) for _ in range(10)]
+        accel_noise = [rng.uniform(-0.1, 0.1) for _ in range(10)]
+        
         # Simulate several cycles
         for i in range(10):
             traction.update(
-                wheel_speed=params["wheel_speed"] + random.uniform(-0.5, 0.5),
-                ground_speed=params["ground_speed"] + random.uniform(-0.3, 0.3),
-                imu_forward_accel=params["imu_accel"] + random.uniform(-0.1, 0.1),
+                wheel_speed=params["wheel_speed"] + wheel_noise[i],
+                ground_speed=params["ground_speed"] + ground_noise[i],
+                imu_forward_accel=params["imu_accel"] + accel_noise[i],
                 yaw_rate=params["yaw_rate"],
                 throttle_input=params["throttle"],
                 grip_multiplier=1.0
@@ -444,11 +557,23 @@ if __name__ == "__main__":
         )
         
         status = traction.get_status()
-        print(f"  Phase: {status['phase']}")
-        print(f"  Slip Ratio: {status['slip_ratio']:.1%}")
-        print(f"  Slip Detected: {status['slip_detected']}")
+        print(f"  Phase: {status.phase}")
+        print(f"  Slip Ratio: {status.slip_ratio:.1%}")
+        print(f"  Slip Detected: {status.slip_detected}")
         print(f"  Throttle: {params['throttle']} -> {result}")
-        print(f"  Multiplier: {status['throttle_multiplier']}")
+        print(f"  Multiplier: {status.throttle_multiplier:.2f}")
         
         # Reset for next scenario
         traction.reset()
+    
+    # Ground speed estimate parked for 5 minutes at 50 Hz: wheels stopped, no GPS fix,
+    # IMU noise only. The estimate must stay bounded by the floored wheel-speed cap.
+    print("\nStandstill drift (5 min, IMU noise sigma 0.3 m/s²):")
+    n = 5 * 60 * 50
+    estimates = LowSpeedTractionManager.simulate_ground_speed(
+        [rng.gauss(0.0, 0.3) for _ in range(n)], [0.0] * n, [0.0] * n,
+        [0.02] * n, [False] * n,
+        traction.GPS_DRIFT_CORRECTION_ALPHA, traction._gps_drift_min_speed_ms,
+        traction.IMU_BIAS_TRACK_GAIN)
+    print(f"  Max estimate: {max(estimates) / KMH_TO_MS:.1f} km/h")
+    print(f"  Final estimate: {estimates[-1] / KMH_TO_MS:.1f} km/h")
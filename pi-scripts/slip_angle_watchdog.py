@@ -51,6 +51,9 @@ import time
 import math
 from car_config import get_config
 
+# km/h * deg/s -> m/s * rad/s (for expected lateral acceleration a = v * ω)
+KMH_DEGS_TO_MS_RADS = math.radians(1.0) / 3.6
+
 
 class SlipAngleWatchdog:
     """
@@ -86,7 +89,6 @@ class SlipAngleWatchdog:
         self._throttle_multiplier = 1.0
         self._slip_start_time = None  # When slip first detected
         self._intervention_active = False
-        self._prev_time = time.time()
         
         # Smoothed values (reduces noise)
         self._lateral_excess_smooth = 0.0
@@ -120,22 +122,19 @@ class SlipAngleWatchdog:
             speed: Vehicle speed (km/h)
             throttle_input: Current throttle command
         """
-        now = time.time()
-        self._prev_time = now
+        now = time.monotonic()
         
         # Store actual lateral for diagnostics
         self.actual_lateral = lateral_accel
         
         # Calculate expected lateral acceleration from circular motion
         # a_lat = v * ω (where v is in m/s, ω is in rad/s)
-        # Convert units: speed km/h -> m/s, yaw_rate deg/s -> rad/s
-        v_ms = speed / 3.6
-        omega_rad = math.radians(yaw_rate)
+        # Unit conversion (km/h -> m/s, deg/s -> rad/s) is folded into one constant
         
         # Expected lateral acceleration magnitude
         # Note: Sign convention - turning left (positive yaw) creates rightward lateral accel
         # So expected lateral has opposite sign to yaw rate
-        self.expected_lateral = abs(v_ms * omega_rad)
+        self.expected_lateral = abs(speed * yaw_rate) * KMH_DEGS_TO_MS_RADS
         
         # Calculate excess: how much more lateral accel than expected
         # Use absolute values - we care about magnitude of slip, not direction
@@ -248,6 +247,7 @@ class SlipAngleWatchdog:
 if __name__ == "__main__":
     import random
 
+    rng = random.Random(0)  # Seeded: reproducible demo output
     saw = SlipAngleWatchdog()
 
     print("IMU-Based Slip Watchdog Simulation")
@@ -285,17 +285,20 @@ if __name__ == "__main__":
         print(f"  Lateral: {params['lateral']:.1f} m/s², Yaw: {params['yaw']:.1f} deg/s, "
               f"Speed: {params['speed']} km/h")
 
+        # Sensor noise for this scenario
+        lateral_noise = [rng.uniform(-0.3, 0.3) for _ in range(20)]
+        yaw_noise = [rng.uniform(-2, 2) for _ in range(20)]
+
         # Run enough iterations to exceed duration threshold
         for i in range(20):  # ~1 second at 20Hz
             saw.update(
-                lateral_accel=params["lateral"] + random.uniform(-0.3, 0.3),
-                yaw_rate=params["yaw"] + random.uniform(-2, 2),
+                lateral_accel=params["lateral"] + lateral_noise[i],
+                yaw_rate=params["yaw"] + yaw_noise[i],
                 speed=params["speed"],
                 throttle_input=params["throttle"],
             )
             # Simulate 20Hz
-            import time as t
-            t.sleep(0.01)  # Speed up for test
+            time.sleep(0.01)  # Speed up for test
 
         status = saw.get_status()
         print(f"  Expected lateral: {status['expected_lateral']:.2f} m/s²")
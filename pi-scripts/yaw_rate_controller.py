@@ -84,6 +84,12 @@ class YawRateController:
         
         # Smoothing
         self.yaw_rate_smoothing = cfg.get_float('yaw_rate_controller', 'yaw_smoothing')
+        
+        # Precomputed bicycle-model factors (unit conversions folded into constants)
+        # steering command -> steer angle (rad)
+        self._steering_to_rad = math.radians(self.max_steering_angle_deg) / 32767.0
+        # km/h * tan(delta) -> desired yaw rate (deg/s), sign-flipped and grip-scaled
+        self._yaw_rate_gain = -math.degrees(1.0) * self.grip_factor / (3.6 * self.wheelbase)
 
         # === State ===
         self._throttle_multiplier = 1.0
@@ -152,37 +158,24 @@ class YawRateController:
         Returns:
             Desired yaw rate in deg/s
         """
-        # Convert speed to m/s
-        v = speed_kmh / 3.6
-
         # Convert steering command to angle
         # steering: -32767 (full left) to +32767 (full right)
         # For bicycle model, positive steering = right turn = negative yaw rate (clockwise)
         # But we'll keep signs consistent with gyro convention
-        delta_deg = (steering / 32767.0) * self.max_steering_angle_deg
-        delta_rad = math.radians(delta_deg)
+        delta_rad = steering * self._steering_to_rad
 
         # Bicycle model: r = v / L * tan(delta)
         # At very small angles, tan(delta) ≈ delta, but we use exact tan
         if abs(delta_rad) < 0.001:
             return 0.0
 
-        tan_delta = math.tan(delta_rad)
-
-        # Yaw rate in rad/s
-        r_rad_s = (v / self.wheelbase) * tan_delta
-
-        # Convert to deg/s
-        # Sign convention: positive steering (right) → negative yaw (clockwise when viewed from above)
-        # Gyro Z typically: positive = counterclockwise
-        # So positive steering → negative desired yaw rate
-        r_deg_s = -math.degrees(r_rad_s)
-
-        # Apply grip factor: real cars don't achieve kinematic yaw rate
-        # due to tire slip (understeer gradient)
-        r_deg_s *= self.grip_factor
-
-        return r_deg_s
+        # _yaw_rate_gain folds in:
+        # - km/h -> m/s and rad/s -> deg/s conversions, divided by wheelbase
+        # - sign convention: positive steering (right) → negative yaw (clockwise when viewed
+        #   from above); gyro Z positive = counterclockwise
+        # - grip factor: real cars don't achieve kinematic yaw rate due to tire slip
+        #   (understeer gradient)
+        return self._yaw_rate_gain * speed_kmh * math.tan(delta_rad)
 
     def _update_intervention(self, speed_kmh: float):
         """